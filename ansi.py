@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+ANSI Terminal Control
+Escape sequences for clearing and redrawing the screen, terminal capability
+detection (done once per output and cached) and line-diff redraws
+"""
+
+import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+CSI = "\033["
+
+# Move the cursor home and clear the screen (what `clear` prints on most terminals)
+CLEAR = CSI + "H" + CSI + "2J"
+
+# Erase the whole line the cursor is on
+CLEAR_LINE = CSI + "2K"
+
+# Windows console mode flag that turns on escape sequence processing
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+# tty: output is a terminal; ansi: escape sequences can be used on it
+Capabilities = namedtuple("Capabilities", "tty ansi")
+
+def up(lines):
+    """Move the cursor up and to the first column"""
+    return f"\r{CSI}{lines}A" if lines else "\r"
+
+def _enable_windows_vt(fd):
+    """Turn on escape sequence processing in a Windows console"""
+    try:
+        import ctypes
+        import msvcrt
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(fd)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(
+            handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (ImportError, AttributeError, OSError):
+        return False
+
+@lru_cache(maxsize=None)
+def _detect(fd):
+    """Probe the terminal behind a file descriptor"""
+    tty = os.isatty(fd)
+    if os.environ.get("TERM") == "dumb":
+        ansi = False
+    elif os.name == "nt":
+        # Redirected output just records the sequences
+        ansi = not tty or _enable_windows_vt(fd)
+    else:
+        ansi = True
+    return Capabilities(tty, ansi)
+
+def capabilities(stream=None):
+    """Return what an output stream supports; each terminal is probed only once
+
+    Streams that are not files (recorders, string buffers) accept escape
+    sequences as plain text.
+    """
+    stream = stream or sys.stdout
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return Capabilities(False, True)
+    return _detect(fd)
+
+class Canvas:
+    """A block of lines drawn at the cursor and then updated in place
+
+    update() returns the output that turns the block drawn last into the
+    new lines, rewriting only the lines that changed; the cursor is left
+    on the line below the block, as after printing it.
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def update(self, lines):
+        previous = self.lines
+        out = [up(len(previous))] if previous else []
+        for number, line in enumerate(lines):
+            if number < len(previous) and previous[number] == line:
+                out.append("\n")
+            elif number < len(previous):
+                out.append(f"{CLEAR_LINE}{line}\n")
+            else:
+                out.append(f"{line}\n")
+        extra = len(previous) - len(lines)
+        if extra > 0:
+            out.append(f"{CLEAR_LINE}\n" * extra + up(extra))
+        self.lines = list(lines)
+        return "".join(out)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Asciicast Recorder
+Records the tutorial as an asciicast v2 file (asciinema) on a virtual clock,
+so a recording takes milliseconds instead of the tutorial's running time
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import catalog
+import terminal
+import tutorial
+
+HEIGHT = 30
+
+# Seconds a recording lingers on each "Press ENTER" prompt before moving on
+DEFAULT_PAUSE = 3.0
+
+def record(locale=tutorial.DEFAULT_LOCALE, mrna=tutorial.DEFAULT_MRNA, speed=1.0):
+    """Play the whole tutorial on a recording renderer; return (renderer, recorder)"""
+    renderer, recorder = terminal.recording_renderer(speed)
+    tutorial.Tutorial(locale, renderer, mrna).run()
+    return renderer, recorder
+
+def events(renderer, recorder, pause=DEFAULT_PAUSE):
+    """Yield the [time, code, data] events of a finished recording
+
+    Frames become "o" (output) events with terminal line endings, every
+    screen clear gets an "m" marker named after the screen, and each prompt
+    becomes a pause followed by the echo of ENTER.
+    """
+    titles = iter([stats.title for stats in renderer.screens[1:]])
+    offset = 0.0
+    for moment, text in recorder.events:
+        moment = round(moment + offset, 6)
+        if text is None:
+            offset += pause
+            yield [round(moment + pause, 6), "o", "\r\n"]
+            continue
+        if terminal.CLEAR in text:
+            yield [moment, "m", next(titles, "")]
+        yield [moment, "o", text.replace("\n", "\r\n")]
+
+def render(locale=tutorial.DEFAULT_LOCALE, mrna=tutorial.DEFAULT_MRNA, speed=1.0,
+           pause=DEFAULT_PAUSE, height=HEIGHT):
+    """Return the asciicast v2 recording of the tutorial in one locale
+
+    The header has no timestamp, so regenerating unchanged content gives an
+    identical file.
+    """
+    renderer, recorder = record(locale, mrna, speed)
+    header = {
+        "version": 2,
+        "width": tutorial.WIDTH,
+        "height": height,
+        "title": renderer.screens[1].title,
+        "env": {"TERM": "xterm-256color"},
+    }
+    lines = [json.dumps(header, ensure_ascii=False)]
+    lines.extend(json.dumps(event, ensure_ascii=False)
+                 for event in events(renderer, recorder, pause))
+    return "\n".join(lines) + "\n"
+
+def main(argv=None):
+    """Record the tutorial from the command line"""
+    parser = argparse.ArgumentParser(description="Record the tutorial as an asciicast v2 file.")
+    parser.add_argument("mrna", nargs="?", default=tutorial.DEFAULT_MRNA,
+                        help="mRNA replayed by the elongation phase (default: %(default)s)")
+    parser.add_argument("-o", "--output",
+                        help="cast file, or - for stdout (default: tutorial-<lang>.cast)")
+    parser.add_argument("--lang", default=tutorial.DEFAULT_LOCALE, choices=catalog.available())
+    parser.add_argument("--speed", type=float, default=1.0, help="animation speed multiplier")
+    parser.add_argument("--pause", type=float, default=DEFAULT_PAUSE,
+                        help="seconds to linger on each ENTER prompt (default: %(default)s)")
+    parser.add_argument("--height", type=int, default=HEIGHT, help="terminal rows")
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    start = time.perf_counter()
+    cast = render(args.lang, args.mrna, args.speed, args.pause, args.height)
+    output = args.output or f"tutorial-{args.lang}.cast"
+    if output == "-":
+        sys.stdout.write(cast)
+    else:
+        try:
+            with open(output, "w", encoding="utf-8", newline="\n") as handle:
+                handle.write(cast)
+        except OSError as error:
+            print(f"[!] {error}", file=sys.stderr)
+            sys.exit(1)
+    print(f"[asciicast] recorded in {time.perf_counter() - start:.3f} s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Batch Protein Translation
+Non-interactive command that translates every transcript of a FASTA/FASTQ file
+"""
+
+import argparse
+import contextlib
+import marshal
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import cache
+import faidx
+import fasta
+import orf
+import translation
+
+# Records are shipped to worker processes in batches of roughly this many bases
+BATCH_BASES = 4 << 20
+BATCH_RECORDS = 4096
+
+# Genetic code tag of a FASTA header
+_TABLE_TAG = re.compile(rb"transl_table=(\d*)")
+
+# Sequences sent to a worker at a time when a batch is mapped over a process pool
+MAP_CHUNK = 64
+
+def record_code(header, default=translation.STANDARD):
+    """Genetic code of a record: its header's transl_table=N tag, or default
+
+    Tags follow the NCBI source modifiers, e.g. ">ND1 [transl_table=2]";
+    ValueError for tables NCBI does not define.
+    """
+    if b"transl_table=" not in header:
+        return default
+    return translation.genetic_code(_TABLE_TAG.search(header).group(1).decode("ascii"))
+
+def translate_records(records, to_stop=False, code=translation.STANDARD):
+    """Translate (header, mRNA) records lazily into (header, protein) records"""
+    for header, sequence in records:
+        protein = translation.translate(sequence, to_stop, record_code(header, code).table)
+        yield header, protein.encode("ascii")
+
+def _record_name(header):
+    """First word of a FASTA header"""
+    return header.split(None, 1)[0] if header.strip() else header
+
+def _orf_label(number, call):
+    """What follows the record name in the header of an ORF, e.g. _orf2 154-1302(+)"""
+    return b"_orf%d %d-%d(%s)" % (number, call.start + 1, call.end, call.strand.encode("ascii"))
+
+def orf_records(records, min_length=30, code=translation.STANDARD):
+    """Call the ORFs of (header, mRNA) records lazily, one (header, protein) record per ORF
+
+    ORF headers are the record name, a serial number and the 1-based
+    coordinates: ">NAME_orf2 154-1302(+)".
+    """
+    for header, sequence in records:
+        name = _record_name(header)
+        calls = orf.find_orfs(sequence, min_length=min_length, code=record_code(header, code))
+        for number, call in enumerate(calls, 1):
+            yield name + _orf_label(number, call), call.protein.encode("ascii")
+
+def _translation_lines(sequence, to_stop, width, code):
+    """Cached result of a translated record: its FASTA lines after the header"""
+    return fasta.wrap(translation.translate(sequence, to_stop, code.table).encode("ascii"), width)
+
+def _orf_parts(sequence, min_length, width, code):
+    """The FASTA records of the ORFs of a sequence, each without its '>NAME'"""
+    calls = orf.find_orfs(sequence, min_length=min_length, code=code)
+    return [_orf_label(number, call) + b"\n" + fasta.wrap(call.protein.encode("ascii"), width)
+            for number, call in enumerate(calls, 1)]
+
+def _orf_lines(sequence, min_length, width, code):
+    """Cached result of the ORFs of a record"""
+    return marshal.dumps(_orf_parts(sequence, min_length, width, code))
+
+def _join_orfs(header, parts):
+    """FASTA records of a record's ORFs from their _orf_parts()"""
+    if not parts:
+        return b""
+    prefix = b">" + _record_name(header)
+    return prefix + prefix.join(parts)
+
+def _code_groups(batch, default):
+    """Split a batch into (genetic code, positions of its records) pairs"""
+    if not any(b"transl_table=" in header for header, _ in batch):
+        return [(default, range(len(batch)))]
+    groups = {}
+    for position, (header, _) in enumerate(batch):
+        groups.setdefault(record_code(header, default), []).append(position)
+    return groups.items()
+
+def write_cached(records, handle, store, mapper=map, to_stop=False, width=60, orfs=None,
+                 code=translation.STANDARD):
+    """Write the translations (or, given a minimum length, the ORFs) of records through a cache
+
+    Each record's output is stored already formatted, so a hit costs one
+    lookup and one write however many ORFs the record has. Misses are
+    computed with mapper, one lookup per genetic code used in a batch.
+    """
+    if orfs is None:
+        options = {"to_stop": to_stop, "width": width}
+        kind, compute = "protein", partial(_translation_lines, to_stop=to_stop, width=width)
+    else:
+        options = {"min_length": orfs, "width": width}
+        kind, compute = "orfs", partial(_orf_lines, min_length=orfs, width=width)
+    count = 0
+    for batch in chunk_records(records):
+        results = [None] * len(batch)
+        for group_code, positions in _code_groups(batch, code):
+            values = store.lookup(kind, [batch[position][1] for position in positions],
+                                  dict(options, table=group_code.table),
+                                  partial(compute, code=group_code), mapper)
+            for position, value in zip(positions, values):
+                results[position] = value
+        for (header, _), result in zip(batch, results):
+            if orfs is None:
+                handle.write(b">" + header + b"\n" + result)
+                count += 1
+                continue
+            parts = marshal.loads(result)
+            handle.write(_join_orfs(header, parts))
+            count += len(parts)
+    return count
+
+def write_records(records, handle, width=60):
+    """Write (header, protein) records to a binary stream, one at a time"""
+    count = 0
+    for header, protein in records:
+        handle.write(fasta.format_record(header, protein, width))
+        count += 1
+    return count
+
+def chunk_records(records, max_bases=BATCH_BASES, max_records=BATCH_RECORDS):
+    """Group records into lists holding about max_bases nucleotides each"""
+    batch = []
+    size = 0
+    for record in records:
+        batch.append(record)
+        size += len(record[1])
+        if size >= max_bases or len(batch) >= max_records:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+def translate_batch(batch, to_stop=False, width=60, code=translation.STANDARD):
+    """Translate a batch of records into one block of formatted FASTA bytes"""
+    output = b"".join(fasta.format_record(header, protein, width)
+                      for header, protein in translate_records(batch, to_stop, code))
+    return output, len(batch)
+
+def orf_batch(batch, min_length=30, width=60, code=translation.STANDARD):
+    """Call the ORFs of a batch of records into one block of formatted FASTA bytes"""
+    output = []
+    count = 0
+    for header, sequence in batch:
+        parts = _orf_parts(sequence, min_length, width, record_code(header, code))
+        output.append(_join_orfs(header, parts))
+        count += len(parts)
+    return b"".join(output), count
+
+def write_parallel(records, handle, workers, to_stop=False, width=60, orfs=None,
+                   code=translation.STANDARD):
+    """Translate records (or call their ORFs) on a process pool and write them in input order"""
+    count = 0
+    pending = deque()
+    if orfs is None:
+        work = partial(translate_batch, to_stop=to_stop, width=width, code=code)
+    else:
+        work = partial(orf_batch, min_length=orfs, width=width, code=code)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch in chunk_records(records):
+            # One pickled round-trip per batch; the result is a single bytes blob
+            pending.append(pool.submit(work, batch))
+            # Bound the number of batches in flight so memory stays constant
+            if len(pending) >= workers * 2:
+                output, done = pending.popleft().result()
+                handle.write(output)
+                count += done
+        while pending:
+            output, done = pending.popleft().result()
+            handle.write(output)
+            count += done
+    return count
+
+@contextlib.contextmanager
+def _mapper(workers):
+    """map(), or a process pool's map when there are several workers"""
+    if workers <= 1:
+        yield map
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield partial(pool.map, chunksize=MAP_CHUNK)
+
+def run(input_path, output_path=None, to_stop=False, width=60, workers=1, ids=None,
+        orfs=None, store=None, code=translation.STANDARD):
+    """Stream input_path through the translation engine into output_path
+
+    ids selects records of an uncompressed FASTA file by name; they are read
+    through its .fai index instead of scanning the whole file. orfs, a
+    minimum length in amino acids, writes the ORFs of each record instead
+    of its translation. store (cache.TranslationCache) reuses the results
+    of earlier runs. code (translation.GeneticCode) translates the records
+    whose header has no transl_table=N tag.
+    """
+    if ids:
+        source = faidx.IndexedFasta(input_path)
+        missing = [name for name in ids if name not in source]
+        if missing:
+            source.close()
+            raise KeyError(missing[0])
+        records = source.records(ids)
+    else:
+        source = fasta.open_input(input_path)
+        records = fasta.read_records(source)
+    sink = fasta.open_output(output_path)
+    try:
+        if store is not None:
+            with _mapper(workers) as mapper:
+                return write_cached(records, sink, store, mapper, to_stop, width, orfs, code)
+        if workers > 1:
+            return write_parallel(records, sink, workers, to_stop, width, orfs, code)
+        if orfs is not None:
+            return write_records(orf_records(records, orfs, code), sink, width)
+        return write_records(translate_records(records, to_stop, code), sink, width)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is sys.stdout.buffer:
+            sink.flush()
+        else:
+            sink.close()
+
+def parse_args(argv=None):
+    """Parse the batch command-line options"""
+    parser = argparse.ArgumentParser(
+        description="Translate every transcript of a FASTA/FASTQ file into protein.")
+    parser.add_argument("input", help="FASTA/FASTQ file of transcripts ('-' for stdin, .gz allowed)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="protein FASTA output file (default: stdout)")
+    parser.add_argument("--to-stop", action="store_true",
+                        help="stop each protein at the first stop codon")
+    parser.add_argument("--width", type=int, default=60,
+                        help="wrap protein lines at this width (0 disables wrapping)")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="translate on N worker processes (default: 1)")
+    parser.add_argument("--id", action="append", dest="ids", metavar="NAME",
+                        help="only translate this record of an indexed FASTA file (repeatable)")
+    parser.add_argument("--code", type=translation.code_option, default=translation.STANDARD,
+                        metavar="N", help="NCBI genetic code of records without a transl_table=N "
+                                          "tag in their header (default: 1, standard)")
+    parser.add_argument("--orfs", action="store_true",
+                        help="write the ORFs of each transcript instead of its full translation")
+    parser.add_argument("--min-length", type=int, default=30, metavar="AA",
+                        help="shortest ORF written by --orfs, in amino acids (default: 30)")
+    parser.add_argument("--cache", action="store_true",
+                        help="reuse the results of earlier runs stored in an on-disk cache")
+    parser.add_argument("--cache-dir", default=cache.DEFAULT_DIRECTORY, metavar="DIR",
+                        help="cache directory (default: %(default)s)")
+    parser.add_argument("--cache-size", type=int, default=cache.DEFAULT_MAX_BYTES >> 20,
+                        metavar="MB", help="cache size cap in MiB; least recently used results "
+                                           "are evicted (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+def main(argv=None):
+    """Batch translation entry point"""
+    args = parse_args(argv)
+    store = None
+    if args.cache:
+        try:
+            store = cache.TranslationCache(args.cache_dir, args.cache_size << 20)
+        except cache.CacheInUse as error:
+            print(f"[!] {error}; translating without it", file=sys.stderr)
+    try:
+        run(args.input, args.output, args.to_stop, args.width, args.workers, args.ids,
+            args.min_length if args.orfs else None, store, args.code)
+        if store is not None:
+            stats = store.stats()
+            print(f"[cache] {stats.hits:,} hits, {stats.misses:,} misses, "
+                  f"{stats.entries:,} results ({stats.size / 1e6:.1f} MB) in {store.directory}",
+                  file=sys.stderr)
+    except KeyError as error:
+        print(f"[!] No record named {error.args[0]!r} in {args.input}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as error:
+        print(f"[!] {error}", file=sys.stderr)
+        sys.exit(1)
+    except BrokenPipeError:
+        # Output piped into e.g. `head`; stop quietly
+        sys.stderr.close()
+    except OSError as error:
+        # Missing or unreadable input, unwritable output, ...
+        print(f"[!] {error}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n[!] Batch translation interrupted by user.", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        if store is not None:
+            store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Translation Cache
+Persistent, content-addressed store of translation results (proteins and ORF
+calls), keyed by a hash of the sequence and of the genetic code and options
+that produced them, kept in an append-only data file with an index and capped
+by least-recently-used eviction
+"""
+
+import argparse
+import hashlib
+import marshal
+import os
+from collections import namedtuple
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "mrna2protein")
+
+# Cap on the data file (1 GiB)
+DEFAULT_MAX_BYTES = 1 << 30
+
+# Eviction keeps the most recently used results up to this share of the cap,
+# so the data file is not compacted again after every run
+EVICT_TO = 0.75
+
+# Part of every key and of the index, so results stored in an older layout
+# are never read back
+FORMAT = 2
+
+DATA_FILE = "results.bin"
+INDEX_FILE = "index.marshal"
+LOCK_FILE = "lock"
+
+# Every result is stored after its key (16 bytes) and length (4 bytes), which
+# are checked on read so a stale or foreign offset is a miss, never a wrong value
+KEY_BYTES = 16
+HEADER_BYTES = KEY_BYTES + 4
+
+# hits/misses: this session; total_*: every session; size: bytes of live results
+Stats = namedtuple("Stats", "hits misses total_hits total_misses entries size")
+
+class CacheInUse(OSError):
+    """The cache directory is locked by another process"""
+
+def _hasher(kind, options):
+    """sha256 state primed with everything in a key but the sequence"""
+    prefix = repr((FORMAT, kind, sorted(options.items()))).encode("utf-8")
+    return hashlib.sha256(prefix + b"\0")
+
+class TranslationCache:
+    """Results of the translation engine stored on disk across runs
+
+    A result is any bytes value computed from one sequence; its key hashes a
+    kind (e.g. "protein"), the options of the computation and the sequence.
+    Results are appended to a data file; the index maps each key to the
+    offset, length and last use (a counter bumped once per lookup) of its
+    result and is rewritten by close(). When the data file outgrows
+    max_bytes, the least recently used results are dropped and the file is
+    compacted. An instance holds an exclusive lock on its directory until
+    close(); opening a directory another process holds raises CacheInUse.
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._lock = self._acquire(os.path.join(directory, LOCK_FILE))
+        self._data_path = os.path.join(directory, DATA_FILE)
+        self._index_path = os.path.join(directory, INDEX_FILE)
+        meta, self.index = self._read_index()
+        self.clock, self.end, self.total_hits, self.total_misses = meta
+        self.size = sum(HEADER_BYTES + length for _, length, _ in self.index.values())
+        self._data = open(self._data_path, "a+b")
+        # Drop whatever an interrupted run appended after the indexed results
+        self._data.truncate(self.end)
+
+    def _acquire(self, path):
+        """Open and exclusively lock the lock file; CacheInUse if another process holds it"""
+        lock = open(path, "ab")
+        if fcntl is None:
+            return lock
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            raise CacheInUse(f"cache {self.directory} is in use by another process") from None
+        return lock
+
+    def _read_index(self):
+        """Return (meta, index) from the index file, or those of an empty cache"""
+        try:
+            with open(self._index_path, "rb") as handle:
+                version, meta, index = marshal.loads(handle.read())
+            if version == FORMAT and os.path.getsize(self._data_path) >= meta[1]:
+                return meta, index
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        return (0, 0, 0, 0), {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def flush(self):
+        """Write the data file and the index to disk"""
+        self._data.flush()
+        temporary = f"{self._index_path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as handle:
+            handle.write(marshal.dumps(
+                (FORMAT, (self.clock, self.end, self.total_hits, self.total_misses), self.index)))
+        os.replace(temporary, self._index_path)
+
+    def close(self):
+        if not self._data.closed:
+            self.flush()
+            self._data.close()
+            self._lock.close()  # releases the lock
+
+    def lookup(self, kind, sequences, options, compute, mapper=map):
+        """Return compute(sequence) for every sequence, computing only the misses
+
+        compute must return bytes and depend only on the sequence and the
+        options (which must have stable reprs), since they form the key.
+        Misses are computed with mapper, e.g. a process pool's map().
+        """
+        hasher = _hasher(kind, options)
+        self.clock += 1
+        values = []
+        missing = []
+        for sequence in sequences:
+            digest = hasher.copy()
+            digest.update(sequence if isinstance(sequence, bytes) else sequence.encode())
+            key = digest.digest()[:16]
+            entry = self.index.get(key)
+            if entry is None:
+                missing.append((len(values), key, sequence))
+                values.append(None)
+                continue
+            offset, length, _ = entry
+            self._data.seek(offset)
+            record = self._data.read(HEADER_BYTES + length)
+            if (len(record) != HEADER_BYTES + length
+                    or not record.startswith(key + length.to_bytes(4, "little"))):
+                # Not the record the index points to: recompute and store it again
+                del self.index[key]
+                self.size -= HEADER_BYTES + length
+                missing.append((len(values), key, sequence))
+                values.append(None)
+                continue
+            self.index[key] = offset, length, self.clock
+            values.append(record[HEADER_BYTES:])
+        computed = mapper(compute, [sequence for _, _, sequence in missing])
+        for (position, key, _), value in zip(missing, computed):
+            values[position] = value
+            if key not in self.index:  # not a sequence repeated within the lookup
+                self.index[key] = self.end, len(value), self.clock
+                self._data.write(key + len(value).to_bytes(4, "little"))
+                self._data.write(value)
+                self.end += HEADER_BYTES + len(value)
+                self.size += HEADER_BYTES + len(value)
+        self.hits += len(values) - len(missing)
+        self.misses += len(missing)
+        self.total_hits += len(values) - len(missing)
+        self.total_misses += len(missing)
+        if self.end > self.max_bytes:
+            self._evict()
+        return values
+
+    def _evict(self):
+        """Keep the most recently used results within EVICT_TO of the cap and compact"""
+        budget = self.max_bytes * EVICT_TO
+        kept = {}
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1][2], reverse=True):
+            if HEADER_BYTES + entry[1] > budget:
+                break
+            budget -= HEADER_BYTES + entry[1]
+            kept[key] = entry
+        temporary = f"{self._data_path}.{os.getpid()}.tmp"
+        end = 0
+        with open(temporary, "wb") as handle:
+            for key, (offset, length, used) in sorted(kept.items(), key=lambda item: item[1][0]):
+                self._data.seek(offset)
+                handle.write(self._data.read(HEADER_BYTES + length))
+                kept[key] = end, length, used
+                end += HEADER_BYTES + length
+        self._data.close()
+        os.replace(temporary, self._data_path)
+        self._data = open(self._data_path, "a+b")
+        self.index = kept
+        self.end = self.size = end
+        self.flush()
+
+    def stats(self):
+        """Hit/miss counters and the size of the store"""
+        return Stats(self.hits, self.misses, self.total_hits, self.total_misses,
+                     len(self.index), self.size)
+
+    def clear(self):
+        """Remove every stored result"""
+        self.index = {}
+        self.end = self.size = self.total_hits = self.total_misses = 0
+        self._data.truncate(0)
+        self.flush()
+
+def main(argv=None):
+    """Inspect or clear the translation cache from the command line"""
+    parser = argparse.ArgumentParser(description="Show or clear the translation cache.")
+    parser.add_argument("directory", nargs="?", default=DEFAULT_DIRECTORY,
+                        help="cache directory (default: %(default)s)")
+    parser.add_argument("--clear", action="store_true", help="remove every stored result")
+    args = parser.parse_args(argv)
+    try:
+        store = TranslationCache(args.directory)
+    except OSError as error:
+        parser.exit(1, f"[!] {error}\n")
+    with store:
+        if args.clear:
+            store.clear()
+        stats = store.stats()
+    print(f"{args.directory}: {stats.entries:,} results, {stats.size / 1e6:.1f} MB, "
+          f"{stats.total_hits:,} hits, {stats.total_misses:,} misses")
+
+if __name__ == "__main__":
+    main()
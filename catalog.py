@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Locale Catalogs
+Loads the tutorial strings of one language, compiled once into a binary cache
+"""
+
+import marshal
+import os
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+CACHE_DIR = os.path.join(LOCALE_DIR, "__pycache__")
+
+# Catalogs already loaded by this process
+_loaded = {}
+
+def available():
+    """Return the codes of the locales that have a catalog"""
+    return sorted(name[:-5] for name in os.listdir(LOCALE_DIR) if name.endswith(".json"))
+
+def compile_catalog(entries):
+    """Join multi-line entries (stored as lists of lines) into single strings"""
+    return {key: "\n".join(value) if isinstance(value, list) else value
+            for key, value in entries.items()}
+
+def _read_cache(path, stamp):
+    """Return the cached catalog if it was compiled from the current source"""
+    try:
+        with open(path, "rb") as handle:
+            cached_stamp, entries = marshal.load(handle)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return entries if cached_stamp == stamp else None
+
+def _write_cache(path, stamp, entries):
+    """Store a compiled catalog; read-only installs simply skip the cache"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as handle:
+            marshal.dump((stamp, entries), handle)
+        os.replace(temporary, path)
+    except OSError:
+        pass
+
+def load(locale):
+    """Return the catalog of one locale, parsing its JSON only when the cache is stale"""
+    if locale in _loaded:
+        return _loaded[locale]
+    source = os.path.join(LOCALE_DIR, f"{locale}.json")
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        raise ValueError(f"no catalog for locale {locale!r}") from None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache = os.path.join(CACHE_DIR, f"{locale}.marshal")
+    entries = _read_cache(cache, stamp)
+    if entries is None:
+        import json  # only needed when (re)compiling
+        with open(source, encoding="utf-8") as handle:
+            entries = compile_catalog(json.load(handle))
+        _write_cache(cache, stamp, entries)
+    _loaded[locale] = entries
+    return entries
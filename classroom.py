@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Classroom Tutorial Server
+Serves the interactive tutorial to a whole class at once over TCP (telnet)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+import catalog
+import terminal
+import tutorial
+
+DEFAULT_PORT = 2323
+
+# Output sent to a student is grouped into frames of at least this length
+FRAME_INTERVAL = 1 / 15
+
+def welcome(locales):
+    """Build the language menu; entries are numbered in the order of locales"""
+    lines = ["", "Protein Translation Tutorial / Tutorial de Tradução de Proteínas", ""]
+    for number, locale in enumerate(locales, 1):
+        lines.append(f"  [{number}] {catalog.load(locale)['meta.language']}")
+    lines += ["", "Choose a language / Escolha o idioma: "]
+    return "\r\n".join(lines).encode("utf-8")
+
+def record_scene(locale, scene, frame_interval=FRAME_INTERVAL):
+    """Run one scene headless and return it as (delay, bytes) steps
+
+    A step whose bytes are None is a prompt that waits for ENTER. Frames that
+    fall within frame_interval of each other are merged into one step, so a
+    typing animation costs each session a write per network frame instead of
+    one per character.
+    """
+    renderer, recorder = terminal.recording_renderer()
+    tutorial.Tutorial(locale, renderer).play(scene)
+    renderer.flush()
+    frames = []  # [first moment, last moment, data]
+    for moment, text in recorder.events:
+        data = None if text is None else text.replace("\n", "\r\n").encode("utf-8")
+        if (data is not None and frames and frames[-1][2] is not None
+                and moment - frames[-1][0] < frame_interval):
+            frames[-1][1] = moment
+            frames[-1][2] += data
+        else:
+            frames.append([moment, moment, data])
+    steps = []
+    last = 0.0
+    for _, moment, data in frames:
+        steps.append((moment - last, data))
+        last = moment
+    return steps
+
+def record_course(locale):
+    """Record every scene in one locale once, to be shared by all sessions"""
+    return [record_scene(locale, scene) for scene in tutorial.SCENES]
+
+class Session:
+    """Per-student state; each session is served by coroutines, not a thread"""
+
+    __slots__ = ("reader", "writer", "speed")
+
+    def __init__(self, reader, writer, speed):
+        self.reader = reader
+        self.writer = writer
+        self.speed = speed
+
+    async def readline(self):
+        """Wait for the student to press ENTER"""
+        line = await self.reader.readline()
+        if not line:
+            raise EOFError
+        return line.decode("utf-8", "replace").strip()
+
+    async def play_scene(self, steps):
+        """Replay one recorded scene at the session's pace"""
+        for delay, data in steps:
+            if delay:
+                await asyncio.sleep(delay / self.speed)
+            if data is None:
+                await self.readline()
+            else:
+                self.writer.write(data)
+                await self.writer.drain()
+
+class ClassroomServer:
+    """Asyncio server running one tutorial session per connection"""
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        locales = catalog.available()
+        self.welcome = welcome(locales)
+        self.courses = {str(number): record_course(locale)
+                        for number, locale in enumerate(locales, 1)}
+        self.active = 0
+        self.served = 0
+        self.completed = 0
+
+    async def handle(self, reader, writer):
+        """Serve one student from language choice to conclusion"""
+        session = Session(reader, writer, self.speed)
+        self.active += 1
+        self.served += 1
+        try:
+            writer.write(self.welcome)
+            await writer.drain()
+            course = self.courses.get(await session.readline(), self.courses["1"])
+            for steps in course:
+                await session.play_scene(steps)
+            self.completed += 1
+        except (EOFError, ConnectionError, ValueError):
+            pass  # ValueError: a line longer than the stream limit
+        finally:
+            self.active -= 1
+            writer.close()
+
+    async def report(self, interval):
+        """Print session counts, peak memory and CPU use every interval seconds"""
+        cpu = time.process_time()
+        while True:
+            await asyncio.sleep(interval)
+            used = time.process_time() - cpu
+            cpu += used
+            memory = ""
+            if resource is not None:
+                peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                memory = f", peak RSS {peak / 1024:.1f} MB"
+            print(f"[classroom] {self.active} active, {self.served} served, "
+                  f"{self.completed} completed{memory}, CPU {100 * used / interval:.1f}%",
+                  file=sys.stderr)
+
+    async def serve(self, host, port, stats_interval=None):
+        """Accept connections until cancelled"""
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"[classroom] serving on {host}:{port} (connect with: telnet {host} {port})",
+              file=sys.stderr)
+        # Keep a reference to the task: the event loop only holds a weak one
+        reporter = asyncio.create_task(self.report(stats_interval)) if stats_interval else None
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+async def student(host, port, answers):
+    """Simulated student: answer every prompt and read until the tutorial ends"""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(answers)
+    await writer.drain()
+    received = 0
+    while True:
+        chunk = await reader.read(65536)
+        if not chunk:
+            break
+        received += len(chunk)
+    writer.close()
+    return received
+
+async def swarm(host, port, clients, language="1"):
+    """Run many simulated students at once and summarize what they received"""
+    answers = (language + "\n" + "\n" * 20).encode("ascii")
+    start = time.monotonic()
+    results = await asyncio.gather(*(student(host, port, answers) for _ in range(clients)),
+                                   return_exceptions=True)
+    failed = [result for result in results if isinstance(result, Exception)]
+    received = [result for result in results if not isinstance(result, Exception)]
+    print(f"{len(received)} sessions finished in {time.monotonic() - start:.1f} s, "
+          f"{sum(received) / 1e6:.1f} MB received, {len(failed)} failed")
+    if failed:
+        print(f"first failure: {failed[0]!r}")
+
+def main(argv=None):
+    """Classroom server entry point"""
+    parser = argparse.ArgumentParser(description="Serve the tutorial to many students over TCP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--speed", type=float, default=1.0, help="animation speed multiplier")
+    parser.add_argument("--stats-interval", type=float, default=None, metavar="SECONDS",
+                        help="print session, memory and CPU statistics periodically")
+    parser.add_argument("--swarm", type=int, metavar="N",
+                        help="instead of serving, connect N simulated students to a server")
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    try:
+        if args.swarm:
+            asyncio.run(swarm(args.host, args.port, args.swarm))
+        else:
+            asyncio.run(ClassroomServer(args.speed).serve(args.host, args.port,
+                                                          args.stats_interval))
+    except KeyboardInterrupt:
+        print("\n[!] Classroom server stopped.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
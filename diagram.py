@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Diagram Templates
+Catalog texts parsed once into literal pieces and slot positions, with an LRU
+cache of rendered diagram frames so a long transcript reuses its frames
+"""
+
+import operator
+from collections import namedtuple
+from functools import lru_cache
+
+# Enough for every (previous codon, codon) pair of the genetic code
+FRAME_CACHE_SIZE = 4096
+
+# Templates with at least this many lines are diagrams, whose frames are
+# cached; shorter texts (e.g. the growing peptide) are filled in directly
+DIAGRAM_LINES = 3
+
+# field: name looked up in the values; position: index of the slot in pieces
+Slot = namedtuple("Slot", "field spec conversion position")
+
+class Template:
+    """A text with {field} slots (str.format syntax with plain field names), parsed once"""
+
+    __slots__ = ("pieces", "slots", "fields", "key", "diagram")
+
+    def __init__(self, text):
+        import string  # imports re, which `import diagram` alone does not need
+        pieces = []
+        slots = []
+        for literal, field, spec, conversion in string.Formatter().parse(text):
+            if literal:
+                pieces.append(literal)
+            if field is not None:
+                slots.append(Slot(field, spec, conversion, len(pieces)))
+                pieces.append("")
+        self.pieces = tuple(pieces)
+        self.slots = tuple(slots)
+        self.fields = tuple(slot.field for slot in slots)
+        # key(values) -> tuple of slot values, the frame cache key
+        if len(self.fields) > 1:
+            self.key = operator.itemgetter(*self.fields)
+        else:
+            self.key = lambda values, fields=self.fields: tuple(values[f] for f in fields)
+        self.diagram = text.count("\n") + 1 >= DIAGRAM_LINES
+
+    def fill(self, values):
+        """Render the template with one value per slot, in slot order"""
+        parts = list(self.pieces)
+        for slot, value in zip(self.slots, values):
+            if slot.conversion:
+                value = {"r": repr, "s": str, "a": ascii}[slot.conversion](value)
+            parts[slot.position] = format(value, slot.spec) if slot.spec else str(value)
+        return "".join(parts)
+
+@lru_cache(maxsize=None)
+def parse(text):
+    """Return the compiled template of a text (each text is parsed only once)"""
+    return Template(text)
+
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def _frame(template, values):
+    """A rendered diagram frame, shared by every step that shows the same values"""
+    return template.fill(values)
+
+def render(text, values):
+    """Fill the {field} slots of a text from a mapping, like text.format_map(values)"""
+    template = parse(text)
+    if not template.slots:
+        return "".join(template.pieces)
+    key = template.key(values)
+    return _frame(template, key) if template.diagram else template.fill(key)
+
+def cache_info():
+    """Hit/miss statistics of the frame cache"""
+    return _frame.cache_info()
+
+def _cycle_values(codons, amino_acids):
+    """The elongation fields of every cycle of a transcript"""
+    for i, (codon, aa) in enumerate(zip(codons, amino_acids)):
+        yield {
+            "codon": codon,
+            "aa": aa,
+            "prev_codon": codons[i - 1] if i > 0 else "───",
+            "prev_aa": amino_acids[i - 1] if i > 0 else "   ",
+        }
+
+def _measure(render_frame, texts, cycles, setup=None, repeat=3):
+    """Return (µs per frame, bytes allocated per frame) for rendering every text each cycle
+
+    setup() runs before every pass; the time is the best of repeat passes.
+    """
+    import time
+    import tracemalloc
+    frames = len(texts) * len(cycles)
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for values in cycles:
+            for text in texts:
+                render_frame(text, values)
+        best = min(best, time.perf_counter() - start)
+    if setup:
+        setup()
+    tracemalloc.start()
+    allocated = 0
+    for values in cycles:
+        for text in texts:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            frame = render_frame(text, values)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+            del frame
+    tracemalloc.stop()
+    return 1e6 * best / frames, allocated / frames
+
+def benchmark(codons=1000, locale="en", seed=0):
+    """Compare str.format_map with compiled templates on a random transcript
+
+    "first view" renders the transcript with an empty frame cache, "replay"
+    renders it again (e.g. a revisited scene or another classroom session).
+    """
+    import random
+
+    import catalog
+    import translation
+    rng = random.Random(seed)
+    sense = [translation.BASES[i >> 4] + translation.BASES[(i >> 2) & 3] + translation.BASES[i & 3]
+             for i in range(64) if translation.STANDARD_CODE[i] != "*"]
+    mrna = "AUG" + "".join(rng.choice(sense) for _ in range(codons - 1))
+    amino_acids = translation.three_letter(translation.translate(mrna))
+    cycles = list(_cycle_values(translation.split_codons(mrna), amino_acids))
+    text = catalog.load(locale)
+    diagrams = [value for value in text.values()
+                if parse(value).diagram and parse(value).slots
+                and set(parse(value).fields) <= set(cycles[0])]
+    rows = [
+        ("str.format_map", lambda text, values: text.format_map(values), None),
+        ("compiled template", lambda text, values: parse(text).fill(parse(text).key(values)),
+         None),
+        ("frame cache, first view", render, _frame.cache_clear),
+        ("frame cache, replay", render, None),
+    ]
+    print(f"{len(cycles)} codons, {len(diagrams)} diagrams per cycle")
+    print(f"{'METHOD':<26} {'µs/FRAME':>10} {'BYTES/FRAME':>12}")
+    for name, function, setup in rows:
+        micros, allocated = _measure(function, diagrams, cycles, setup)
+        print(f"{name:<26} {micros:>10.2f} {allocated:>12.0f}")
+    info = cache_info()
+    print(f"frame cache: {info.currsize} frames, {info.hits} hits, {info.misses} misses")
+
+def main(argv=None):
+    """Benchmark diagram rendering from the command line"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the diagram template cache.")
+    parser.add_argument("--codons", type=int, default=1000, help="transcript length")
+    parser.add_argument("--lang", default="en", help="catalog whose diagrams are rendered")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    benchmark(args.codons, args.lang, args.seed)
+
+if __name__ == "__main__":
+    main()
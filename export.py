@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Tutorial Export
+Renders every scene of the tutorial in one pass, without sleeping, as a plain
+text transcript, Markdown, a self-contained HTML page with typing animations
+and an asciicast recording
+"""
+
+import argparse
+import html
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import asciicast
+import catalog
+import terminal
+import tutorial
+
+FORMATS = ("txt", "md", "html", "cast")
+
+DEFAULT_DIRECTORY = "export"
+
+# Only one scene is shown at a time (the one in the URL fragment, or the first),
+# so its animations start when it is opened. Typed text reveals one character
+# per step of the original animation; printed text appears at its moment.
+STYLE = """
+body { margin: 0; display: flex; background: #111; color: #ddd; font-family: sans-serif; }
+nav { flex: 0 0 18em; padding: 1em; font-size: 0.9em; }
+nav ol { padding-left: 1.5em; }
+a { color: #8cf; }
+main { flex: 1; padding: 1em; overflow-x: auto; }
+pre { font: 15px/1.3 "DejaVu Sans Mono", Menlo, Consolas, monospace; }
+section { display: none; }
+section:target, main:not(:has(section:target)) section:first-child { display: block; }
+.pager { font-size: 1.5em; }
+.t { display: inline-block; vertical-align: bottom; overflow: hidden; white-space: pre; width: 0;
+     animation: type var(--d) steps(var(--n), end) var(--s) forwards; }
+.p { opacity: 0; animation: show 0s var(--s) forwards; }
+@keyframes type { to { width: calc(var(--n) * 1ch); } }
+@keyframes show { to { opacity: 1; } }
+@media (prefers-reduced-motion: reduce) {
+  .t, .p { animation: none; width: auto; opacity: 1; }
+}
+@media print {
+  nav, .pager { display: none; }
+  section { display: block !important; break-after: page; }
+  .t, .p { animation: none; width: auto; opacity: 1; }
+}
+"""
+
+class Transcript(terminal.Renderer):
+    """Renderer that records each screen as (start, duration, text) pieces instead of drawing
+
+    The virtual clock gives every piece the moment it would have appeared;
+    typed text keeps its typing duration so the HTML page can replay it.
+    """
+
+    def __init__(self, speed=1.0):
+        super().__init__(clock=terminal.VirtualClock(speed), inputs=terminal.ScriptedInput())
+        self.pages = []  # (title, start time, pieces) per screen
+
+    def begin_screen(self, title):
+        self.pages.append((title, self.clock.now, []))
+
+    def clear(self):
+        """Screens already start on a new page"""
+
+    def write(self, text):
+        if text:
+            self.pages[-1][2].append((self.clock.now, 0.0, text))
+
+    def type_text(self, text, delay=tutorial.DEFAULT_DELAY):
+        start = self.clock.now
+        self.clock.sleep(max(delay, 0) * len(text))
+        self.pages[-1][2].append((start, self.clock.now - start, text))
+        self.write("\n")
+
+    def animate_dots(self, duration=2):
+        self.clock.sleep(duration)
+        self.write("\n")
+
+    def input(self, prompt=""):
+        self.write(prompt)
+        return self.inputs()
+
+def record(locale, mrna=tutorial.DEFAULT_MRNA):
+    """Play every scene of a locale into a Transcript"""
+    transcript = Transcript()
+    player = tutorial.Tutorial(locale, transcript, mrna)
+    for scene in tutorial.SCENES:
+        player.play(scene)
+    return transcript
+
+def page_text(pieces):
+    """The final text of a screen"""
+    return "".join(text for _, _, text in pieces)
+
+def _strip_banner(text, title):
+    """Remove the title banner that opens every screen (Markdown has headings)"""
+    banner = f"{'=' * tutorial.WIDTH}\n{title.center(tutorial.WIDTH)}\n{'=' * tutorial.WIDTH}\n"
+    return text[len(banner):].lstrip("\n") if text.startswith(banner) else text
+
+def to_text(transcript):
+    """Plain text transcript: every screen, separated by a blank line"""
+    return "\n".join(page_text(pieces) for _, _, pieces in transcript.pages)
+
+def to_markdown(transcript):
+    """Markdown: a heading per screen and its contents as a preformatted block"""
+    parts = []
+    for title, _, pieces in transcript.pages:
+        parts.append(f"## {title}\n\n```text\n{_strip_banner(page_text(pieces), title)}```\n")
+    return f"# {transcript.pages[0][0]}\n\n" + "\n".join(parts)
+
+def _html_pieces(pieces, origin):
+    """HTML for the pieces of one screen, with animation timing in CSS variables"""
+    out = []
+    for start, duration, text in pieces:
+        offset = start - origin
+        if not duration:
+            out.append(f'<span class="p" style="--s:{offset:.2f}s">{html.escape(text)}</span>')
+            continue
+        # Typed text: one animated span per line, at the speed it was typed
+        step = duration / len(text)
+        for number, line in enumerate(text.split("\n")):
+            if number:
+                out.append("\n")
+                offset += step
+            if line:
+                out.append(f'<span class="t" style="--n:{len(line)};--d:{len(line) * step:.2f}s;'
+                           f'--s:{offset:.2f}s">{html.escape(line)}</span>')
+                offset += len(line) * step
+    return "".join(out)
+
+def to_html(transcript, locale):
+    """A self-contained HTML page: one section per screen and a table of contents"""
+    keys = [scene.key for scene in tutorial.SCENES]
+    items = []
+    sections = []
+    for number, (key, (title, origin, pieces)) in enumerate(zip(keys, transcript.pages)):
+        items.append(f'<li><a href="#{key}">{html.escape(title)}</a></li>')
+        pager = []
+        if number:
+            pager.append(f'<a href="#{keys[number - 1]}">◀</a>')
+        if number + 1 < len(keys):
+            pager.append(f'<a href="#{keys[number + 1]}">▶</a>')
+        sections.append(f'<section id="{key}"><pre>{_html_pieces(pieces, origin)}</pre>'
+                        f'<p class="pager">{" ".join(pager)}</p></section>')
+    return (f'<!DOCTYPE html>\n<html lang="{locale}">\n<head>\n<meta charset="utf-8">\n'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            f'<title>{html.escape(transcript.pages[0][0])}</title>\n<style>{STYLE}</style>\n'
+            f'</head>\n<body>\n<nav><ol>\n' + "\n".join(items) + '\n</ol></nav>\n<main>\n'
+            + "\n".join(sections) + "\n</main>\n</body>\n</html>\n")
+
+def export_locale(locale, directory=DEFAULT_DIRECTORY, formats=FORMATS,
+                  mrna=tutorial.DEFAULT_MRNA):
+    """Write the tutorial of one locale in the given formats and return the file paths"""
+    transcript = record(locale, mrna)
+    renderers = {
+        "txt": to_text,
+        "md": to_markdown,
+        "html": lambda transcript: to_html(transcript, locale),
+        "cast": lambda transcript: asciicast.render(locale, mrna),
+    }
+    paths = []
+    for extension in formats:
+        path = os.path.join(directory, f"tutorial-{locale}.{extension}")
+        with open(path, "w", encoding="utf-8", newline="\n") as handle:
+            handle.write(renderers[extension](transcript))
+        paths.append(path)
+    return paths
+
+def _export_args(args):
+    """Unpack one export_locale() call for the process pool"""
+    return export_locale(*args)
+
+def export(directory=DEFAULT_DIRECTORY, locales=None, formats=FORMATS,
+           mrna=tutorial.DEFAULT_MRNA, workers=None):
+    """Export several locales (all by default), one per worker process"""
+    locales = locales or catalog.available()
+    os.makedirs(directory, exist_ok=True)
+    jobs = [(locale, directory, formats, mrna) for locale in locales]
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        results = list(map(_export_args, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_export_args, jobs))
+    return [path for paths in results for path in paths]
+
+def main(argv=None):
+    """Export the tutorial from the command line"""
+    parser = argparse.ArgumentParser(
+        description="Export the whole tutorial as text, Markdown, HTML and asciicast "
+                    "without animating it.")
+    parser.add_argument("mrna", nargs="?", default=tutorial.DEFAULT_MRNA,
+                        help="mRNA replayed by the elongation phase (default: %(default)s)")
+    parser.add_argument("-o", "--output-dir", default=DEFAULT_DIRECTORY,
+                        help="directory for the exported files (default: %(default)s)")
+    parser.add_argument("--lang", nargs="+", choices=catalog.available(),
+                        help="locales to export (default: all)")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=FORMATS,
+                        help="formats to write (default: all)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per locale, up to the CPU count)")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    try:
+        paths = export(args.output_dir, args.lang, args.format, args.mrna, args.workers)
+    except OSError as error:
+        # Unwritable output directory, raised here or in a worker process
+        print(f"[!] {error}", file=sys.stderr)
+        sys.exit(1)
+    for path in paths:
+        print(path)
+    print(f"[export] {len(paths)} files in {time.perf_counter() - start:.2f} s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Indexed FASTA
+Random access to the records of a large FASTA file through a samtools-style
+.fai index (built once and cached next to the file) and memory-mapped slices
+"""
+
+import argparse
+import mmap
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+
+# Records are scanned for line breaks in chunks of this many bytes
+SCAN_CHUNK = 16 << 20
+
+# The columns of a .fai line: sequence length, byte offset of its first base,
+# bases per line and bytes per line (bases plus the line break)
+Entry = namedtuple("Entry", "length offset line_bases line_width")
+
+# Name and remaining columns of every line of a .fai file
+_INDEX_LINE = re.compile(r"^([^\t\n]+)\t([^\n]*)$", re.MULTILINE)
+
+def index_path(path):
+    """Where the index of a FASTA file is cached"""
+    return path + ".fai"
+
+def _bases(data, start, end):
+    """Count the bases between two offsets of a mapped file (line breaks excluded)"""
+    bases = 0
+    for position in range(start, end, SCAN_CHUNK):
+        chunk = data[position:min(position + SCAN_CHUNK, end)]
+        bases += len(chunk) - chunk.count(b"\n") - chunk.count(b"\r")
+    return bases
+
+def _entry(data, name, start, end):
+    """Index the sequence lines between two offsets, checking that they are regular"""
+    first = data.find(b"\n", start, end)
+    line_width = (first if first != -1 else end) + 1 - start
+    line_bases = len(data[start:start + line_width].rstrip(b"\r\n"))
+    length = _bases(data, start, end)
+    content = end
+    while content > start and data[content - 1] in b"\r\n":
+        content -= 1
+    if length:
+        if not line_bases:  # a blank line before the bases
+            raise ValueError(f"sequence lines of {name!r} have unequal lengths")
+        lines = -(-length // line_bases)
+        regular = content - start == length + (lines - 1) * (line_width - line_bases)
+        # Every line but the last ends with the line break of the first one
+        for column in range(line_bases, line_width):
+            breaks = data[start + column:content:line_width]
+            regular = regular and breaks == data[start + column:start + column + 1] * (lines - 1)
+        if not regular:
+            raise ValueError(f"sequence lines of {name!r} have unequal lengths")
+    return Entry(length, start, line_bases, line_width)
+
+def build_index(path):
+    """Scan a FASTA file once and return its index as {name: Entry}, in file order"""
+    index = {}
+    with open(path, "rb") as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            return index
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:1] != b">":
+                raise ValueError(f"{path} is not a FASTA file")
+            header = 0
+            while header != -1:
+                line_end = data.find(b"\n", header)
+                if line_end == -1:
+                    line_end = len(data)
+                following = data.find(b"\n>", line_end)
+                end = len(data) if following == -1 else following + 1
+                # The name is the first word of the header, as in samtools
+                words = data[header + 1:line_end].split(None, 1)
+                name = words[0].decode("latin-1") if words else ""
+                if name in index:
+                    raise ValueError(f"duplicate sequence name {name!r} in {path}")
+                index[name] = _entry(data, name, min(line_end + 1, end), end)
+                header = end if following != -1 else -1
+    return index
+
+def write_index(path, index):
+    """Store an index next to its FASTA file; read-only directories simply skip it"""
+    try:
+        temporary = f"{index_path(path)}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="latin-1", newline="\n") as handle:
+            for name, entry in index.items():
+                handle.write("\t".join(map(str, (name,) + entry)) + "\n")
+        os.replace(temporary, index_path(path))
+    except OSError:
+        pass
+
+def read_index(path):
+    """Return the cached index of a FASTA file, or None when it is missing or stale
+
+    Entries are left as their column text and parsed when a record is first
+    fetched, since a transcriptome index holds hundreds of thousands of names.
+    """
+    try:
+        if os.stat(index_path(path)).st_mtime_ns < os.stat(path).st_mtime_ns:
+            return None
+        with open(index_path(path), encoding="latin-1") as handle:
+            return dict(_INDEX_LINE.findall(handle.read()))
+    except (OSError, ValueError):
+        return None
+
+def _parse_entry(columns):
+    """Entry of the column text of a .fai line"""
+    try:
+        return Entry(*map(int, columns.split("\t")[:4]))
+    except (ValueError, TypeError):
+        raise ValueError(f"malformed index line: {columns!r}") from None
+
+def load_index(path):
+    """Return the index of a FASTA file, building and caching it when needed"""
+    index = read_index(path)
+    if index is None:
+        index = build_index(path)
+        write_index(path, index)
+    return index
+
+class IndexedFasta:
+    """A FASTA file opened for random access by record name
+
+    Records are read as slices of a read-only memory map, so fetching one
+    transcript never reads the rest of the file.
+    """
+
+    def __init__(self, path):
+        if path.endswith(".gz"):
+            raise ValueError("indexed FASTA files must be uncompressed")
+        self.path = path
+        self.index = load_index(path)
+        self._handle = open(path, "rb")
+        self._data = (mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+                      if self.index else b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._handle.close()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __getitem__(self, name):
+        return self.fetch(name)
+
+    def entry(self, name):
+        """Index entry of a record; KeyError for unknown names"""
+        entry = self.index[name]
+        if isinstance(entry, str):
+            entry = self.index[name] = _parse_entry(entry)
+        return entry
+
+    def _offset(self, entry, position):
+        """File offset of a 0-based position of a record"""
+        lines, column = divmod(position, entry.line_bases)
+        return entry.offset + lines * entry.line_width + column
+
+    def fetch(self, name, start=0, end=None):
+        """Return bases [start, end) of a record as bytes; KeyError for unknown names"""
+        entry = self.entry(name)
+        end = entry.length if end is None else min(end, entry.length)
+        start = max(start, 0)
+        if start >= end:
+            return b""
+        chunk = self._data[self._offset(entry, start):self._offset(entry, end)]
+        if entry.line_width != entry.line_bases:
+            chunk = chunk.replace(b"\n", b"").replace(b"\r", b"")
+        return chunk
+
+    def header(self, name):
+        """The header line of a record as bytes, without its '>'; KeyError for unknown names"""
+        offset = self.entry(name).offset
+        # The header line ends just before the first base (or at the end of the file)
+        end = offset - 1 if self._data[offset - 1:offset] == b"\n" else offset
+        start = self._data.rfind(b"\n", 0, end) + 1
+        return self._data[start + 1:end].strip()
+
+    def records(self, names=None):
+        """Yield (header, sequence) byte pairs, of every record or of the given names"""
+        for name in self.index if names is None else names:
+            yield self.header(name), self.fetch(name)
+
+def main(argv=None):
+    """Index a FASTA file and print records from the command line"""
+    parser = argparse.ArgumentParser(
+        description="Build the .fai index of a FASTA file and fetch records by name.")
+    parser.add_argument("fasta", help="uncompressed FASTA file")
+    parser.add_argument("names", nargs="*", help="records to print (default: only index)")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    try:
+        reference = IndexedFasta(args.fasta)
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"[!] {error}\n")
+    with reference:
+        opened = time.perf_counter()
+        for name in args.names:
+            try:
+                sys.stdout.write(f">{name}\n{reference.fetch(name).decode('ascii')}\n")
+            except KeyError:
+                parser.error(f"no record named {name!r} in {args.fasta}")
+        print(f"[faidx] {len(reference)} records, index ready in {opened - start:.3f} s",
+              file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
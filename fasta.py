@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+FASTA/FASTQ Streaming I/O
+Reads and writes sequence records one at a time with buffered, chunked I/O
+"""
+
+import gzip
+import sys
+
+# Size of the read/write buffers used for large files (1 MiB)
+BUFFER_SIZE = 1 << 20
+
+def open_input(path):
+    """Open a (possibly gzipped) sequence file for binary reading; '-' is stdin"""
+    if path == "-":
+        return sys.stdin.buffer
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb", buffering=BUFFER_SIZE)
+
+def open_output(path):
+    """Open a file for binary writing; '-' or None is stdout"""
+    if path in (None, "-"):
+        return sys.stdout.buffer
+    if path.endswith(".gz"):
+        return gzip.open(path, "wb")
+    return open(path, "wb", buffering=BUFFER_SIZE)
+
+def _parse_record(text):
+    """Split the text of one FASTA record (without its '>') into (header, sequence)"""
+    header, _, body = text.partition(b"\n")
+    if b" " in body or b"\t" in body or b"\x0b" in body or b"\x0c" in body:
+        sequence = b"".join(line.strip() for line in body.split(b"\n"))
+    else:
+        sequence = body.replace(b"\n", b"").replace(b"\r", b"")
+    return header.strip(), sequence
+
+def _next_header(block, start):
+    """Position of the '>' of the next header line in a block at or after start (>= 1), or -1"""
+    # A one-byte search is several times faster than looking for b"\n>"
+    position = block.find(b">", start)
+    while position != -1 and block[position - 1:position] != b"\n":
+        position = block.find(b">", position + 1)
+    return position
+
+def read_fasta(handle):
+    """Yield (header, sequence) byte pairs from a FASTA stream
+
+    The stream is read in BUFFER_SIZE blocks that are cut at the '>' opening
+    each record, so a record costs a few bytes operations however many lines
+    it has.
+    """
+    pieces = []  # the record being read, which can span several blocks
+    in_record = False  # lines before the first header are ignored
+    line_start = True  # the previous block ended with a line break
+    for block in iter(lambda: handle.read(BUFFER_SIZE), b""):
+        start = 0
+        header = 0 if line_start and block.startswith(b">") else _next_header(block, 1)
+        while header != -1:
+            if in_record:
+                pieces.append(block[start:header])
+                yield _parse_record(b"".join(pieces))
+            pieces = []
+            in_record = True
+            start = header + 1
+            header = _next_header(block, start)
+        if in_record:
+            pieces.append(block[start:])
+        line_start = block.endswith(b"\n")
+    if in_record:
+        yield _parse_record(b"".join(pieces))
+
+def read_fastq(handle):
+    """Yield (header, sequence) byte pairs from a four-line FASTQ stream"""
+    while True:
+        header = handle.readline()
+        if not header:
+            return
+        if not header.strip():
+            continue
+        if not header.startswith(b"@"):
+            raise ValueError(f"malformed FASTQ header: {header[:40]!r}")
+        sequence = handle.readline().strip()
+        handle.readline()  # '+' separator
+        handle.readline()  # quality string
+        yield header[1:].strip(), sequence
+
+def read_records(handle):
+    """Yield (header, sequence) pairs, detecting FASTA or FASTQ from the first byte"""
+    first = handle.peek(1)[:1] if hasattr(handle, "peek") else b""
+    if first == b"@":
+        return read_fastq(handle)
+    return read_fasta(handle)
+
+def wrap(sequence, width=60):
+    """Return the sequence lines of a FASTA record, wrapped at width"""
+    if width <= 0 or len(sequence) <= width:
+        return sequence + b"\n"
+    lines = [sequence[i:i + width] for i in range(0, len(sequence), width)]
+    return b"\n".join(lines) + b"\n"
+
+def format_record(header, sequence, width=60):
+    """Format one FASTA record as bytes, wrapping the sequence at width"""
+    return b">" + header + b"\n" + wrap(sequence, width)
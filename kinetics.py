@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Elongation Kinetics
+tRNA-pool-aware codon dwell times and predicted translation times (tAI-style)
+"""
+
+import math
+from functools import lru_cache
+
+import translation
+
+# Approximate human tRNA gene copy numbers per anticodon (5'->3', DNA
+# letters), after GtRNAdb; used as a proxy for the abundance of each tRNA
+HUMAN_TRNA_GENES = {
+    "AGC": 29, "CGC": 4, "TGC": 8,                          # Ala
+    "ACG": 7, "CCG": 4, "CCT": 5, "TCG": 6, "TCT": 6,       # Arg
+    "GTT": 33,                                              # Asn
+    "GTC": 19,                                              # Asp
+    "GCA": 30,                                              # Cys
+    "CTG": 20, "TTG": 11,                                   # Gln
+    "CTC": 13, "TTC": 13,                                   # Glu
+    "CCC": 5, "GCC": 14, "TCC": 9,                          # Gly
+    "GTG": 11,                                              # His
+    "AAT": 14, "GAT": 3, "TAT": 5,                          # Ile
+    "AAG": 10, "CAA": 6, "CAG": 10, "TAA": 4, "TAG": 3,     # Leu
+    "CTT": 17, "TTT": 16,                                   # Lys
+    "CAT": 20,                                              # Met
+    "GAA": 12,                                              # Phe
+    "AGG": 10, "CGG": 4, "TGG": 7,                          # Pro
+    "AGA": 11, "CGA": 4, "GCT": 8, "TGA": 4,                # Ser
+    "AGT": 10, "CGT": 6, "TGT": 6,                          # Thr
+    "CCA": 9,                                               # Trp
+    "GTA": 14,                                              # Tyr
+    "AAC": 11, "CAC": 16, "TAC": 5,                         # Val
+}
+
+# Wobble pairing at anticodon position 34: codon third base -> selective
+# penalty s (dos Reis et al. 2004); A34 is read as inosine in eukaryotes
+WOBBLE = {
+    "A": {"U": 0.0, "C": 0.28, "A": 0.9999},
+    "G": {"C": 0.0, "U": 0.41},
+    "U": {"A": 0.0, "G": 0.68},
+    "C": {"G": 0.0},
+}
+
+# Dwell time of a codon: a fixed peptidyl-transfer/translocation step plus
+# tRNA selection, which slows down as the cognate tRNA becomes scarcer.
+# A perfectly adapted codon then takes ~0.15 s (~6.7 aa/s).
+DEFAULT_STEP_TIME = 0.05
+DEFAULT_DECODING_RATE = 10.0
+
+_PAIR = {"A": "U", "C": "G", "G": "C", "U": "A"}
+_STANDARD_TABLE = translation.compile_code(translation.STANDARD_CODE)
+
+def _pool_key(pool):
+    """Turn a tRNA pool mapping into a hashable cache key"""
+    return tuple(sorted(pool.items()))
+
+@lru_cache(maxsize=32)
+def _weights(pool_key):
+    """Relative adaptiveness w (0-1] of each of the 64 codons for a tRNA pool"""
+    pool = {anticodon.upper().replace("T", "U"): copies for anticodon, copies in pool_key}
+    absolute = []
+    for index in range(64):
+        first, second, third = (translation.BASES[(index >> shift) & 3] for shift in (4, 2, 0))
+        total = 0.0
+        for base34, pairs in WOBBLE.items():
+            if third in pairs:
+                total += (1.0 - pairs[third]) * pool.get(base34 + _PAIR[second] + _PAIR[first], 0)
+        absolute.append(total)
+    sense = [w for index, w in enumerate(absolute) if translation.STANDARD_CODE[index] != "*"]
+    top = max(sense)
+    relative = [w / top for w in absolute]
+    # Codons without any decoding tRNA get the geometric mean of the others
+    known = [w for w in relative if w > 0]
+    fallback = math.exp(sum(map(math.log, known)) / len(known))
+    return tuple(w if w > 0 else fallback for w in relative)
+
+def codon_weights(pool=HUMAN_TRNA_GENES):
+    """Return the tAI relative adaptiveness of the 64 codons, in codon-index order"""
+    return _weights(_pool_key(pool))
+
+@lru_cache(maxsize=32)
+def _dwell_table(pool_key, step_time, decoding_rate):
+    """Build the 256-entry dwell-time lookup table for a tRNA pool"""
+    weights = _weights(pool_key)
+    table = [step_time + 1.0 / (decoding_rate * w) for w in weights]
+    # Stop codons are read by release factors, not tRNAs
+    for index, aa in enumerate(translation.STANDARD_CODE):
+        if aa == "*":
+            table[index] = step_time + 1.0 / decoding_rate
+    mean = sum(table) / len(table)
+    return tuple(table + [mean] * (256 - len(table)))  # ambiguous codons
+
+def dwell_table(pool=HUMAN_TRNA_GENES, step_time=DEFAULT_STEP_TIME,
+                decoding_rate=DEFAULT_DECODING_RATE):
+    """Return the (memoized) per-codon dwell times in seconds, indexed by codon byte"""
+    return _dwell_table(_pool_key(pool), step_time, decoding_rate)
+
+def _coding_codons(mrna):
+    """Encoded codons from the start of the mRNA up to and including the first stop"""
+    codes = translation.encode_codons(mrna)
+    stop = codes.translate(_STANDARD_TABLE).find(b"*")
+    return codes if stop == -1 else codes[:stop + 1]
+
+def translation_time(mrna, pool=HUMAN_TRNA_GENES, **options):
+    """Predict how long (seconds) one ribosome takes to translate the coding sequence"""
+    table = dwell_table(pool, **options)
+    return sum(map(table.__getitem__, _coding_codons(mrna)))
+
+def codon_rates(mrna, pool=HUMAN_TRNA_GENES, **options):
+    """Per-codon elongation rates (codons/s) for the polysome simulator"""
+    table = dwell_table(pool, **options)
+    return [1.0 / table[code] for code in _coding_codons(mrna)]
+
+def tai(mrna, pool=HUMAN_TRNA_GENES):
+    """tRNA adaptation index: geometric mean of w over the sense codons"""
+    weights = codon_weights(pool)
+    codes = [code for code in _coding_codons(mrna)
+             if code < 64 and translation.STANDARD_CODE[code] != "*"]
+    if not codes:
+        return 0.0
+    return math.exp(sum(math.log(weights[code]) for code in codes) / len(codes))
+
+def rank_constructs(constructs, pool=HUMAN_TRNA_GENES, **options):
+    """Rank (name, mRNA) pairs by predicted translation time, fastest first"""
+    if isinstance(constructs, dict):
+        constructs = constructs.items()
+    times = [(name, translation_time(mrna, pool, **options)) for name, mrna in constructs]
+    return sorted(times, key=lambda item: item[1])
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Kozak Context Scoring
+Scores the start-codon context of every AUG and models leaky scanning
+"""
+
+import math
+import re
+
+import orf
+
+# Base frequencies around vertebrate start codons (gccRccAUGG), approximated
+# from Kozak (1987); offsets are relative to the A of AUG (+1), so -3 is the
+# purine position and +4 the G right after the codon.
+KOZAK_FREQUENCIES = {
+    -6: {"A": 0.22, "C": 0.28, "G": 0.33, "T": 0.17},
+    -5: {"A": 0.26, "C": 0.39, "G": 0.23, "T": 0.12},
+    -4: {"A": 0.25, "C": 0.53, "G": 0.15, "T": 0.07},
+    -3: {"A": 0.61, "C": 0.02, "G": 0.36, "T": 0.01},
+    -2: {"A": 0.27, "C": 0.49, "G": 0.13, "T": 0.11},
+    -1: {"A": 0.15, "C": 0.55, "G": 0.21, "T": 0.09},
+    4: {"A": 0.23, "C": 0.16, "G": 0.46, "T": 0.15},
+}
+
+# Score (in bits) at which a scanning 40S subunit initiates half of the time
+DEFAULT_MIDPOINT = 2.0
+
+_START = re.compile(b"ATG")
+
+def _genome_offset(offset):
+    """Convert a Kozak position (+1 = A of AUG, no position 0) to a 0-based offset"""
+    return offset if offset < 0 else offset - 1
+
+class KozakPWM:
+    """Position weight matrix compiled into per-column byte lookup tables"""
+
+    def __init__(self, frequencies=KOZAK_FREQUENCIES, background=0.25):
+        weights = {
+            offset: {base: math.log2(freq / background) for base, freq in column.items()}
+            for offset, column in frequencies.items()
+        }
+        # Each column spans from its lowest weight to its highest one, both
+        # taken with 0 (the neutral value of N and other bases)
+        span = sum(max(max(col.values()), 0.0) - min(min(col.values()), 0.0)
+                   for col in weights.values())
+        # Every column becomes a bytes.translate table of non-negative lane
+        # values; the per-column totals must fit in one byte so the columns
+        # can be summed with plain big-integer addition without carries (one
+        # unit of headroom per column absorbs rounding).
+        self.scale = (255 - len(weights)) / span
+        self.columns = []
+        self.offset = 0.0
+        for offset, column in sorted(weights.items()):
+            floor = min(min(column.values()), 0.0)
+            table = bytearray([round(-floor * self.scale)] * 256)  # N and others: neutral
+            for base, weight in column.items():
+                value = round((weight - floor) * self.scale)
+                table[ord(base)] = table[ord(base.lower())] = value
+            self.columns.append((_genome_offset(offset), bytes(table)))
+            self.offset += floor
+        # Each window starts `before` bases upstream of the A of AUG
+        self.before = -min(min(offset for offset, _ in self.columns), 0)
+        self.width = self.before + max(max(offset for offset, _ in self.columns), 0) + 1
+        self.columns = [(offset + self.before, table) for offset, table in self.columns]
+
+    def lanes(self, sequence, positions):
+        """Return one quantized score byte for each start position of the sequence"""
+        dna = orf.as_dna(sequence)
+        width = self.width
+        padded = b"N" * self.before + dna + b"N" * (width - self.before)
+        # Gather the context windows back to back, then read every PWM column
+        # as one strided slice, so scoring costs one translate and one
+        # big-integer addition per column instead of a loop per position.
+        windows = b"".join([padded[pos:pos + width] for pos in positions])
+        total = 0
+        for index, table in self.columns:
+            total += int.from_bytes(windows[index::width].translate(table), "big")
+        return total.to_bytes(len(positions), "big")
+
+    def score(self, lane):
+        """Convert a quantized lane value back into a log-odds score in bits"""
+        return lane / self.scale + self.offset
+
+STANDARD_PWM = KozakPWM()
+
+def score_starts(sequence, pwm=STANDARD_PWM):
+    """Return (position, score) for every AUG of the sequence, 5' to 3'"""
+    dna = orf.as_dna(sequence)
+    positions = list(map(re.Match.start, _START.finditer(dna)))
+    scores = [pwm.score(lane) for lane in range(256)]
+    return list(zip(positions, [scores[lane] for lane in pwm.lanes(dna, positions)]))
+
+def initiation_probability(score, midpoint=DEFAULT_MIDPOINT):
+    """Chance that a scanning 40S subunit initiates at an AUG with this score"""
+    return 1.0 / (1.0 + 2.0 ** (midpoint - score))
+
+def leaky_scanning(sequence, midpoint=DEFAULT_MIDPOINT, pwm=STANDARD_PWM):
+    """Return (position, score, probability) for each AUG under leaky scanning
+
+    The 40S subunit meets the AUGs in 5' to 3' order and initiates at each
+    one with a probability set by its Kozak score; the subunits that skip it
+    (leak past) continue to the next AUG. The probabilities sum to the
+    fraction of subunits that initiate anywhere on the transcript.
+    """
+    remaining = 1.0
+    sites = []
+    for pos, score in score_starts(sequence, pwm):
+        chance = initiation_probability(score, midpoint)
+        sites.append((pos, score, remaining * chance))
+        remaining *= 1.0 - chance
+    return sites
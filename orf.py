@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Open Reading Frame Finder
+Locates AUG...STOP reading frames the way the scanning 40S subunit does
+"""
+
+import re
+from collections import namedtuple
+
+import packed
+import translation
+
+# start/end are 0-based, half-open coordinates on the forward strand and
+# include the stop codon; frame is 0-2 counted from the 5' end of the strand
+ORF = namedtuple("ORF", "strand frame start end protein")
+
+# Uppercase DNA with U read as T, so every search needs a single pattern
+_NORMALIZE = bytes.maketrans(b"acgtunU", b"ACGTTNT")
+_COMPLEMENT = bytes.maketrans(b"ACGTUNacgtun", b"TGCAANTGCAAN")
+
+# First start codon after a stop (or the 5' end) up to the next in-frame stop.
+# Starts are read as M, or, with alternative starts, as any lowercase letter:
+# the start_table of a genetic code writes every initiation codon in lowercase
+_PATTERNS = {
+    alternative: (re.compile(start + r"[^*]*\*"), re.compile(start + r"[^*]*(?:\*|$)"),
+                  re.compile(start))
+    for alternative, start in ((False, "M"), (True, "[a-z]"))
+}
+
+def as_dna(sequence):
+    """Return the sequence as uppercase DNA bytes"""
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii", "replace")
+    return bytes(sequence).translate(_NORMALIZE)
+
+def reverse_complement(sequence):
+    """Return the reverse complement of a sequence as DNA bytes"""
+    return as_dna(sequence).translate(_COMPLEMENT)[::-1]
+
+def _frame_orfs(protein, all_starts, min_length, partial, alternative_starts=False):
+    """Yield (first, last) amino-acid offsets of the ORFs in one translated frame"""
+    complete, partial_orf, starts = _PATTERNS[alternative_starts]
+    pattern = partial_orf if partial else complete
+    for match in pattern.finditer(protein):
+        start, end = match.span()
+        # Length excludes the stop codon
+        stop = end - 1 if protein[end - 1:end] == "*" else end
+        while start != -1 and stop - start >= min_length:
+            yield start, end
+            if not all_starts:
+                break
+            following = starts.search(protein, start + 1, stop)
+            start = following.start() if following else -1
+
+def find_orfs(sequence, min_length=30, all_starts=False, both_strands=False,
+              partial=False, code=translation.STANDARD, alternative_starts=False):
+    """Find ORFs in all three (or six) reading frames in a single linear pass
+
+    min_length is counted in amino acids without the stop codon. By default
+    only the first AUG after each stop is used, as a scanning ribosome would;
+    all_starts=True also reports the nested ORFs of every downstream AUG.
+    partial=True keeps ORFs that run off the 3' end without a stop codon.
+    code (translation.GeneticCode) sets the stop codons and the amino acids;
+    alternative_starts=True also opens ORFs at its other initiation codons
+    (e.g. GUG and UUG in bacteria), which are then translated as M.
+    """
+    if isinstance(sequence, packed.PackedSequence):
+        # Translated frame by frame straight from the 2-bit form
+        dna = sequence
+        reverse = sequence.reverse_complement
+    else:
+        dna = as_dna(sequence)
+        reverse = lambda: dna.translate(_COMPLEMENT)[::-1]
+    strands = [("+", dna)]
+    if both_strands:
+        strands.append(("-", reverse()))
+    length = len(dna)
+    table = code.start_table if alternative_starts else code.table
+    orfs = []
+    for strand, seq in strands:
+        for frame in range(3):
+            protein = translation.translate(seq[frame:], table=table)
+            for first, last in _frame_orfs(protein, all_starts, min_length, partial,
+                                           alternative_starts):
+                start = frame + 3 * first
+                end = frame + 3 * last
+                if strand == "-":
+                    start, end = length - end, length - start
+                peptide = protein[first:last]
+                if alternative_starts:
+                    peptide = "M" + peptide[1:].upper()
+                orfs.append(ORF(strand, frame, start, end, peptide))
+    orfs.sort(key=lambda orf: (orf.start, orf.strand, orf.end))
+    return orfs
+
+def scan(sequence, min_length=0, code=translation.STANDARD):
+    """Follow the 40S subunit from the 5' cap to the first AUG and return its ORF
+
+    Returns None when the transcript has no AUG, or when the ORF it opens is
+    shorter than min_length amino acids. code sets where the ORF stops.
+    """
+    dna = as_dna(sequence)
+    start = dna.find(b"ATG")
+    if start == -1:
+        return None
+    protein = translation.translate(dna[start:], table=code.table)
+    stop = protein.find("*")
+    if stop == -1:
+        stop = end = len(protein)
+    else:
+        end = stop + 1
+    if stop < min_length:
+        return None
+    return ORF("+", start % 3, start, start + 3 * end, protein[:end])
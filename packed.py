@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Packed Nucleotide Sequences
+2-bit storage for transcripts and genomes (four bases per byte), with side
+tables for N and ambiguity codes, zero-copy slicing, and codons read straight
+from the packed bytes
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+
+import translation
+
+# Bases use the codes of translation.BASES (U=0, C=1, A=2, G=3), packed most
+# significant bits first, so three packed bases read as one 6-bit number are
+# already a codon index, and three bytes hold exactly four codons
+_VALUES = {base: value for value, base in enumerate(translation.BASES)}
+_VALUES["T"] = _VALUES["U"]
+
+# Complements of the IUPAC ambiguity codes (N, S and W are their own)
+_AMBIGUOUS_COMPLEMENT = bytes.maketrans(b"RYKMBVDH", b"YRMKVBHD")
+
+# Runs of one character outside ACGTU
+_AMBIGUOUS = re.compile(rb"([^ACGTUacgtu])\1*")
+
+# Ambiguity table of every sequence made only of ACGTU
+_UNAMBIGUOUS = (array("q"), array("q"), b"")
+
+def _position_table(shift):
+    """bytes.translate table packing a base into bits shift..shift+1 (others become 0)"""
+    table = bytearray(256)
+    for base, value in _VALUES.items():
+        table[ord(base)] = table[ord(base.lower())] = value << shift
+    return bytes(table)
+
+_PACK = [_position_table(shift) for shift in (6, 4, 2, 0)]
+
+# Letter of the base at each of the four positions of a packed byte
+_UNPACK = [bytes(ord(translation.BASES[(byte >> shift) & 3]) for byte in range(256))
+           for shift in (6, 4, 2, 0)]
+
+# Pieces of the four 6-bit codons in a group of three packed bytes b0 b1 b2
+_HIGH6 = bytes(byte >> 2 for byte in range(256))  # codon 0 from b0
+_LOW2 = bytes((byte & 3) << 4 for byte in range(256))  # codon 1 from b0 ...
+_HIGH4 = bytes(byte >> 4 for byte in range(256))  # ... and b1
+_LOW4 = bytes((byte & 15) << 2 for byte in range(256))  # codon 2 from b1 ...
+_HIGH2 = bytes(byte >> 6 for byte in range(256))  # ... and b2
+_LOW6 = bytes(byte & 63 for byte in range(256))  # codon 3 from b2
+
+# Complement (U<->A is 0<->2, C<->G is 1<->3: flip the high bit of each base)
+# and reverse the order of the four bases in a byte
+_REVERSE_COMPLEMENT = bytes(
+    sum((((byte ^ 0xAA) >> (2 * k)) & 3) << (6 - 2 * k) for k in range(4))
+    for byte in range(256))
+
+def _merge(*streams):
+    """Bitwise OR of equally long byte strings (one big-integer operation)"""
+    total = 0
+    for stream in streams:
+        total |= int.from_bytes(stream, "big")
+    return total.to_bytes(len(streams[0]), "big")
+
+def _shift(data, bases):
+    """Drop the first bases (0-3) of packed data, moving the rest to byte boundaries"""
+    if not bases:
+        return data
+    bits = 8 * len(data)
+    value = (int.from_bytes(data, "big") << (2 * bases)) & ((1 << bits) - 1)
+    return value.to_bytes(len(data), "big")
+
+class PackedSequence:
+    """A nucleotide sequence stored at 2 bits per base
+
+    Slices are views that share the packed buffer and the ambiguity table
+    with their parent. Letters are read back in uppercase, as RNA.
+    """
+
+    __slots__ = ("_data", "_start", "_length", "_ambiguous")
+
+    def __init__(self, data, start, length, ambiguous):
+        self._data = data
+        self._start = start
+        self._length = length
+        # (starts, ends, letters): sorted runs of one ambiguous letter, in
+        # buffer coordinates, shared by every view of the buffer
+        self._ambiguous = ambiguous
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("packed sequences only support contiguous slices")
+            return PackedSequence(self._data, self._start + start, max(stop - start, 0),
+                                  self._ambiguous)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("packed sequence index out of range")
+        return str(self[index:index + 1])
+
+    def __bytes__(self):
+        return self.decode()
+
+    def __str__(self):
+        return self.decode().decode("ascii")
+
+    def __repr__(self):
+        preview = str(self[:20])
+        return f"<PackedSequence {preview}{'...' if self._length > 20 else ''} ({self._length} nt)>"
+
+    @property
+    def nbytes(self):
+        """Bytes of packed storage behind this view"""
+        return (self._length + 3) // 4
+
+    def _runs(self, start=0, end=None):
+        """Yield the (start, end, letter) ambiguity runs overlapping [start, end) of the view"""
+        end = self._length if end is None else end
+        starts, ends, letters = self._ambiguous
+        low = self._start + start
+        high = self._start + end
+        for run in range(bisect_right(ends, low), len(starts)):
+            if starts[run] >= high:
+                break
+            yield (max(starts[run], low) - self._start, min(ends[run], high) - self._start,
+                   letters[run:run + 1])
+
+    def _aligned(self, offset=0, length=None):
+        """Packed bytes of length bases of the view from offset on, starting at a byte boundary"""
+        first = self._start + offset
+        length = self._length - offset if length is None else length
+        chunk = self._data[first >> 2:((first + length + 3) >> 2) + 1]
+        return _shift(chunk, first & 3)[:(length + 3) >> 2]
+
+    def decode(self):
+        """Return the sequence as uppercase RNA ASCII bytes"""
+        data = self._aligned()
+        out = bytearray(4 * len(data))
+        for position, table in enumerate(_UNPACK):
+            out[position::4] = data.translate(table)
+        del out[self._length:]
+        for start, end, letter in self._runs():
+            out[start:end] = letter * (end - start)
+        return bytes(out)
+
+    def codons(self, frame=0):
+        """Encode the codons of a reading frame like translation.encode_codons
+
+        Codon indices are cut straight out of the packed bytes; codons that
+        overlap an ambiguous base get the translation.INVALID bit.
+        """
+        count = max(self._length - frame, 0) // 3
+        if not count:
+            return b""
+        groups = (count + 3) // 4
+        data = self._aligned(frame, 3 * count).ljust(3 * groups, b"\0")
+        first, second, third = data[0::3], data[1::3], data[2::3]
+        out = bytearray(4 * groups)
+        out[0::4] = first.translate(_HIGH6)
+        out[1::4] = _merge(first.translate(_LOW2), second.translate(_HIGH4))
+        out[2::4] = _merge(second.translate(_LOW4), third.translate(_HIGH2))
+        out[3::4] = third.translate(_LOW6)
+        del out[count:]
+        for start, end, _ in self._runs(frame, frame + 3 * count):
+            first_codon = (start - frame) // 3
+            last_codon = (end - 1 - frame) // 3
+            out[first_codon:last_codon + 1] = bytes([translation.INVALID]) * (
+                last_codon + 1 - first_codon)
+        return bytes(out)
+
+    def translate(self, frame=0, to_stop=False, table=translation._STANDARD):
+        """Translate one reading frame into a one-letter protein sequence"""
+        protein = self.codons(frame).translate(table).decode("ascii")
+        if to_stop:
+            stop = protein.find("*")
+            if stop != -1:
+                protein = protein[:stop]
+        return protein
+
+    def reverse_complement(self):
+        """Return the reverse complement as a new packed sequence"""
+        data = self._aligned()
+        padding = 4 * len(data) - self._length
+        reverse = _shift(data.translate(_REVERSE_COMPLEMENT)[::-1], padding)
+        runs = list(self._runs())[::-1]
+        ambiguous = (array("q", [self._length - end for _, end, _ in runs]),
+                     array("q", [self._length - start for start, _, _ in runs]),
+                     b"".join(letter for _, _, letter in runs).translate(_AMBIGUOUS_COMPLEMENT))
+        return PackedSequence(reverse, 0, self._length, ambiguous)
+
+def pack(sequence):
+    """Pack a nucleotide sequence (str or bytes, DNA or RNA, any case)"""
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii", "replace")
+    sequence = bytes(sequence)
+    length = len(sequence)
+    padded = sequence + b"U" * (-length % 4)
+    data = _merge(*(padded[position::4].translate(table)
+                    for position, table in enumerate(_PACK))) if padded else b""
+    if not sequence.translate(None, b"ACGTUacgtu"):
+        return PackedSequence(data, 0, length, _UNAMBIGUOUS)
+    starts = array("q")
+    ends = array("q")
+    letters = bytearray()
+    for match in _AMBIGUOUS.finditer(sequence):
+        starts.append(match.start())
+        ends.append(match.end())
+        letters += match.group(1).upper()
+    return PackedSequence(data, 0, length, (starts, ends, bytes(letters)))
+
+def pack_many(sequences):
+    """Pack several sequences into one shared buffer and return a view of each"""
+    sequences = [item.encode("ascii", "replace") if isinstance(item, str) else bytes(item)
+                 for item in sequences]
+    whole = pack(b"".join(sequences))
+    views = []
+    offset = 0
+    for sequence in sequences:
+        views.append(whole[offset:offset + len(sequence)])
+        offset += len(sequence)
+    return views
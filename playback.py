@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Real-Speed Playback
+Animates the translation of a whole transcript codon by codon at a biological
+elongation rate, drawn at a fixed frame rate
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import fasta
+import orf
+import terminal
+import translation
+import tutorial
+
+# Eukaryotic ribosomes add ~5-10 amino acids per second
+DEFAULT_RATE = 6.0
+
+DEFAULT_FPS = 30
+
+# Codons shown on each side of the A site
+CONTEXT = 5
+
+# A command-line argument that is a sequence rather than a file name
+_SEQUENCE = re.compile(r"[ACGTUNacgtun\s]+")
+
+def frames(length, rate=DEFAULT_RATE, fps=DEFAULT_FPS):
+    """Yield (moment, codons translated) for each frame of a playback
+
+    Frames are 1/fps apart, or one codon apart when the rate is lower than
+    the frame rate; faster rates translate several codons per frame.
+    """
+    if rate <= 0 or fps <= 0:
+        raise ValueError("rate and fps must be positive")
+    interval = max(1.0 / fps, 1.0 / rate)
+    frame = 0
+    while True:
+        moment = frame * interval
+        done = min(int(moment * rate + 1e-9), length)
+        yield moment, done
+        if done == length:
+            return
+        frame += 1
+
+def _clock_time(seconds):
+    """Format seconds as h:mm:ss"""
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes // 60}:{minutes % 60:02d}:{seconds:02d}"
+
+def status_lines(codons, done, peptide, moment, rate):
+    """The three lines of one frame: mRNA around the A site, progress and peptide"""
+    before = " ".join(codons[max(done - CONTEXT, 0):done])
+    site = f"[{codons[done]}]" if done < len(codons) else "[ ■ ]"
+    after = " ".join(codons[done + 1:done + 1 + CONTEXT])
+    width = 4 * CONTEXT - 1
+    mrna = (f"5' {'…' if done > CONTEXT else ' '}{before:>{width}} {site} {after:<{width}}"
+            f"{'…' if done + 1 + CONTEXT < len(codons) else ' '} 3'")
+    progress = (f"codon {done:,}/{len(codons):,} ({100 * done / len(codons):5.1f}%)   "
+                f"{rate:g} aa/s   {_clock_time(moment)} / {_clock_time(len(codons) / rate)}")
+    return [mrna, progress, f"peptide: {peptide}"]
+
+def play(mrna, rate=DEFAULT_RATE, fps=DEFAULT_FPS, screen=None, lateness=None):
+    """Animate the coding part of an mRNA: from its first AUG, as found by a
+    scanning 40S subunit (orf.scan), to the stop codon
+
+    lateness, if given, receives how late (seconds) each frame was drawn.
+    """
+    screen = screen or terminal.Renderer()
+    mrna = translation.normalize(mrna)
+    call = orf.scan(mrna)
+    if call is None:
+        raise ValueError("the mRNA has no start codon (AUG)")
+    mrna = mrna[call.start:call.end]
+    amino_acids = translation.three_letter(translation.translate(mrna, to_stop=True))
+    codons = translation.split_codons(mrna)[:len(amino_acids)]
+    if not codons:
+        raise ValueError("the mRNA has no coding codons")
+    peptide = tutorial.Peptide()
+    last = 0.0
+    shown = 0
+    for moment, done in frames(len(codons), rate, fps):
+        for aa in amino_acids[shown:done]:
+            peptide.append(aa)
+        shown = done
+        screen.redraw(status_lines(codons, done, peptide, moment, rate))
+        screen.sleep(moment - last)  # sends the frame, then waits for its deadline
+        if lateness is not None:
+            lateness.append(screen.clock.lag())
+        last = moment
+    screen.flush()
+
+def read_mrna(source):
+    """Return a sequence given directly, or the first record of a FASTA/FASTQ file
+
+    Arguments that are neither a file nor made only of nucleotides (e.g. a
+    mistyped file name) raise ValueError.
+    """
+    if source != "-" and not os.path.exists(source):
+        if not _SEQUENCE.fullmatch(source):
+            raise ValueError(f"{source!r} is neither a file nor an mRNA sequence")
+        return source
+    with fasta.open_input(source) as handle:
+        for _, sequence in fasta.read_records(handle):
+            return sequence.decode("ascii")
+    raise ValueError(f"no sequence in {source}")
+
+def main(argv=None):
+    """Play back a transcript from the command line"""
+    parser = argparse.ArgumentParser(
+        description="Animate the translation of a transcript at a biological speed.")
+    parser.add_argument("mrna", help="coding sequence, or a FASTA/FASTQ file (- for stdin)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="amino acids per second (default: %(default)s)")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS,
+                        help="frames per second (default: %(default)s)")
+    parser.add_argument("--stats", action="store_true",
+                        help="report frame pacing and CPU use at the end (stderr)")
+    args = parser.parse_args(argv)
+    if args.rate <= 0 or args.fps <= 0:
+        parser.error("--rate and --fps must be positive")
+    start = time.monotonic()
+    cpu = time.process_time()
+    lateness = []
+    try:
+        play(read_mrna(args.mrna), args.rate, args.fps, lateness=lateness)
+    except (OSError, ValueError) as error:
+        print(f"[!] {error}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+    if args.stats and lateness:
+        wall = time.monotonic() - start
+        ordered = sorted(lateness)
+        print(f"[playback] {len(lateness)} frames in {wall:.1f} s, "
+              f"lateness median {1e3 * ordered[len(ordered) // 2]:.2f} ms, "
+              f"p99 {1e3 * ordered[int(len(ordered) * 0.99)]:.2f} ms, "
+              f"max {1e3 * ordered[-1]:.2f} ms, "
+              f"CPU {100 * (time.process_time() - cpu) / wall:.1f}%", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Polysome Simulator
+Stochastic multi-ribosome (TASEP) model of many ribosomes translating an mRNA
+"""
+
+import argparse
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import kinetics
+import terminal
+import translation
+
+# Typical eukaryotic parameters: one initiation every ~10 s, ~6 codons/s
+# elongation and a ribosome footprint of ~30 nucleotides (10 codons)
+DEFAULT_INITIATION_RATE = 0.1
+DEFAULT_ELONGATION_RATE = 6.0
+DEFAULT_FOOTPRINT = 10
+
+# density: mean number of ribosomes with their A site on each codon
+# proteins / protein_rate: completed chains, and chains per second
+# collisions: hops attempted while the ribosome ahead was in the way
+# frames: (time, A-site positions) snapshots for driving the animation
+PolysomeResult = namedtuple(
+    "PolysomeResult",
+    "density proteins protein_rate collisions mean_ribosomes duration frames")
+
+def uniform_rates(mrna, rate=DEFAULT_ELONGATION_RATE):
+    """Return a constant per-codon elongation rate for the coding part of an mRNA"""
+    protein = translation.translate(mrna)
+    stop = protein.find("*")
+    return [rate] * (len(protein) if stop == -1 else stop + 1)  # stop codon included
+
+def simulate(rates, initiation_rate=DEFAULT_INITIATION_RATE, duration=3600.0,
+             footprint=DEFAULT_FOOTPRINT, warmup=0.0, frame_interval=None, seed=None):
+    """Run a Gillespie simulation of ribosomes moving along one transcript
+
+    rates[i] is the elongation rate (codons/s) out of codon i; leaving the
+    last codon terminates translation and releases a protein. Statistics are
+    collected over `duration` seconds after an initial `warmup` period.
+    """
+    length = len(rates)
+    if not length:
+        raise ValueError("the transcript needs at least one codon")
+    if min(rates) <= 0:
+        raise ValueError("elongation rates must be positive")
+    if initiation_rate < 0:
+        raise ValueError("the initiation rate cannot be negative")
+    if duration <= 0:
+        raise ValueError("the duration must be positive")
+    rng = random.Random(seed)
+    expovariate = rng.expovariate
+    uniform = rng.random
+    top = max(rates)
+    end = warmup + duration
+    positions = []  # A-site codon of each ribosome, 3'-most first
+    entered = []  # time each ribosome reached its current codon
+    occupancy = [0.0] * length
+    proteins = collisions = 0
+    frames = []
+    next_frame = warmup if frame_interval else end
+    now = 0.0
+    # Uniformized direct method: every ribosome fires at the fastest rate and
+    # the event is thinned to the codon's true rate, so choosing an event is
+    # O(1) and no rate sums ever need to be updated.
+    while True:
+        total = initiation_rate + len(positions) * top
+        if not total:
+            break  # no ribosome on the mRNA and none can initiate
+        now += expovariate(total)
+        if now >= end:
+            break
+        while now >= next_frame:
+            frames.append((next_frame - warmup, tuple(positions)))
+            next_frame += frame_interval
+        draw = uniform() * total
+        if draw < initiation_rate:
+            if not positions or positions[-1] >= footprint:
+                positions.append(0)
+                entered.append(now)
+            continue
+        draw = (draw - initiation_rate) / top
+        index = int(draw)
+        codon = positions[index]
+        if (draw - index) * top >= rates[codon]:
+            continue
+        if index and positions[index - 1] - codon <= footprint:
+            if now >= warmup:
+                collisions += 1
+            continue
+        if now > warmup:
+            occupancy[codon] += now - max(entered[index], warmup)
+        if codon == length - 1:
+            del positions[0], entered[0]
+            if now >= warmup:
+                proteins += 1
+        else:
+            positions[index] = codon + 1
+            entered[index] = now
+    for codon, since in zip(positions, entered):
+        occupancy[codon] += end - max(since, warmup)
+    density = [value / duration for value in occupancy]
+    return PolysomeResult(density, proteins, proteins / duration, collisions,
+                          sum(density), duration, frames)
+
+def _simulate_args(args):
+    """Unpack one simulate() call for the process pool"""
+    rates, kwargs = args
+    return simulate(rates, **kwargs)
+
+def simulate_many(transcripts, workers=1, **kwargs):
+    """Simulate a list of per-codon rate lists, optionally on a process pool"""
+    jobs = [(rates, kwargs) for rates in transcripts]
+    if workers <= 1:
+        return list(map(_simulate_args, jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_simulate_args, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+def render_frame(length, positions, width=60):
+    """Draw the ribosomes on an mRNA as a single line of ASCII art"""
+    track = ["═"] * width
+    for codon in positions:
+        track[min(codon * width // length, width - 1)] = "■"
+    return "5' " + "".join(track) + " 3'"
+
+def animate(result, length, delay=0.1, width=60, screen=None):
+    """Replay the frames of a simulation result in the terminal
+
+    Each frame redraws the track and its status line in place; only the
+    lines that changed are rewritten.
+    """
+    screen = screen or terminal.Renderer()
+    ruler = "   1" + f"{length:>{width - 1}}"
+    for moment, positions in result.frames:
+        screen.redraw([render_frame(length, positions, width), ruler,
+                       f"t={moment:7.1f} s   ribosomes: {len(positions):3d}"])
+        screen.sleep(delay)
+    screen.flush()
+
+def main(argv=None):
+    """Simulate a polysome on one mRNA and print its statistics"""
+    parser = argparse.ArgumentParser(description="Simulate ribosomes translating an mRNA.")
+    parser.add_argument("mrna", help="coding sequence (RNA or DNA)")
+    parser.add_argument("--duration", type=float, default=3600.0, help="simulated seconds")
+    parser.add_argument("--warmup", type=float, default=600.0, help="seconds discarded first")
+    parser.add_argument("--initiation-rate", type=float, default=DEFAULT_INITIATION_RATE)
+    parser.add_argument("--elongation-rate", type=float, default=DEFAULT_ELONGATION_RATE)
+    parser.add_argument("--trna-kinetics", action="store_true",
+                        help="derive per-codon rates from the human tRNA pool")
+    parser.add_argument("--animate", action="store_true", help="replay the ribosomes")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    if args.trna_kinetics:
+        rates = kinetics.codon_rates(args.mrna)
+    else:
+        rates = uniform_rates(args.mrna, args.elongation_rate)
+    try:
+        result = simulate(rates, args.initiation_rate, args.duration, warmup=args.warmup,
+                          frame_interval=1.0 if args.animate else None, seed=args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.animate:
+        try:
+            animate(result, len(rates))
+        except KeyboardInterrupt:
+            pass
+    print(f"Codons: {len(rates)}")
+    print(f"Proteins: {result.proteins} ({result.protein_rate * 60:.2f} per minute)")
+    print(f"Mean ribosomes on the mRNA: {result.mean_ribosomes:.2f}")
+    print(f"Collisions: {result.collisions}")
+
+if __name__ == "__main__":
+    main()
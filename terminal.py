@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Terminal Renderer
+Frame-buffered output for the tutorial: text is collected in memory and sent
+to the terminal with a single write per frame tick, paced by a deadline clock
+"""
+
+import os
+import sys
+import time
+
+import ansi
+
+# Never draw more often than this, even at high animation speeds
+MIN_FRAME_INTERVAL = 1 / 60
+
+# After a stall longer than this (e.g. a suspended laptop) stop catching up
+MAX_LAG = 1.0
+
+CLEAR = ansi.CLEAR
+
+class Clock:
+    """Animation clock that sleeps until monotonic deadlines instead of for durations
+
+    Each sleep() moves the deadline forward by the nominal duration, so the
+    time lost to scheduler overshoot and drawing is absorbed by the next
+    sleep instead of accumulating. speed scales every duration (2.0 runs the
+    animations twice as fast).
+    """
+
+    def __init__(self, speed=1.0):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self._deadline = None
+
+    def sleep(self, seconds, wait=time.sleep):
+        """Wait until the previous deadline plus seconds (scaled by speed)
+
+        wait(timeout) does the actual waiting; it may return True to report
+        that it was interrupted (e.g. by a keypress), which sleep() passes on.
+        """
+        now = time.monotonic()
+        if self._deadline is None or now - self._deadline > MAX_LAG:
+            self._deadline = now
+        self._deadline += seconds / self.speed
+        remaining = self._deadline - now
+        if remaining > 0:
+            return bool(wait(remaining))
+        return False
+
+    def lag(self):
+        """Seconds by which the animation is running behind its deadline"""
+        if self._deadline is None:
+            return 0.0
+        return max(time.monotonic() - self._deadline, 0.0)
+
+    def reset(self):
+        """Forget the deadline, e.g. after waiting for the user"""
+        self._deadline = None
+
+class VirtualClock:
+    """Clock for headless runs: sleeping only advances a virtual time counter"""
+
+    def __init__(self, speed=1.0):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self.now = 0.0
+
+    def sleep(self, seconds, wait=None):
+        """Advance the virtual time without blocking"""
+        self.now += seconds / self.speed
+        return False
+
+    def lag(self):
+        """A virtual clock is never behind"""
+        return 0.0
+
+    def reset(self):
+        """Nothing to forget: virtual time is exact"""
+
+class Keyboard:
+    """Non-blocking keypresses from a terminal, read in cbreak mode with termios/select
+
+    Use as a context manager around the tutorial; the terminal settings are
+    restored on exit. When stdin is not a terminal (or termios is missing, as
+    on Windows) keypresses are not detected and answers are read with input().
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self._saved = None
+
+    @property
+    def active(self):
+        """True while the terminal is in cbreak mode"""
+        return self._saved is not None
+
+    def __enter__(self):
+        # Only interactive sessions need termios, tty and select
+        try:
+            import termios
+            import tty
+        except ImportError:  # not available on Windows
+            return self
+        if self.stream.isatty():
+            self._fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._restore()
+
+    def _restore(self):
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def wait(self, timeout):
+        """Sleep for up to timeout seconds; return True early if a key was pressed
+
+        Only the bytes of that keypress are consumed, so a second key pressed
+        later stays queued for the next prompt.
+        """
+        if not self.active:
+            time.sleep(timeout)
+            return False
+        import select
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return False
+        os.read(self._fd, 32)  # one key, including multi-byte escape sequences
+        return True
+
+    def readline(self):
+        """Read the answer to a prompt: ENTER or space answers at once, any other
+        key starts a line of input (e.g. a navigation command)"""
+        if not self.active:
+            return input()
+        typed = os.read(self._fd, 32).decode(self.stream.encoding or "utf-8", "replace")
+        if typed in ("\n", "\r", " "):
+            return ""
+        if "\n" in typed or "\r" in typed:  # a whole line arrived at once
+            return typed.replace("\r", "\n").split("\n")[0]
+        sys.stdout.write(typed)
+        sys.stdout.flush()
+        saved = self._saved
+        self._restore()
+        try:
+            return typed + input()
+        finally:
+            import tty
+            self._saved = saved
+            tty.setcbreak(self._fd)
+
+class ScriptedInput:
+    """Input source that answers prompts from a list of lines (then with ENTER)"""
+
+    def __init__(self, lines=()):
+        self._lines = iter(lines)
+        self.count = 0
+
+    def __call__(self):
+        self.count += 1
+        return next(self._lines, "")
+
+class Recorder:
+    """Output stream and input source that records frames on a virtual clock
+
+    events is a list of (virtual time, text) pairs; a text of None marks a
+    prompt where the tutorial waits for ENTER.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.events = []
+
+    def write(self, text):
+        self.events.append((self.clock.now, text))
+
+    def flush(self):
+        pass
+
+    def __call__(self):
+        self.events.append((self.clock.now, None))
+        return ""
+
+class ScreenStats:
+    """Output counters for one tutorial screen"""
+
+    def __init__(self, title):
+        self.title = title
+        self.requests = 0  # write()/print() calls made by the scene code
+        self.writes = 0  # frames actually written to the stream
+        self.bytes = 0
+
+class Renderer:
+    """Collect output for the current frame and write it in one go"""
+
+    def __init__(self, stream=None, clock=None, inputs=input, keys=None):
+        self.stream = stream
+        self.clock = clock or Clock()
+        self.inputs = inputs
+        self.keys = keys  # a Keyboard: a keypress skips to the end of the scene
+        self.skipping = False
+        self.screens = [ScreenStats("(start)")]
+        self._frame = []
+        self._page = []  # everything written since the screen was last cleared
+        self._canvas = None  # block updated in place by redraw()
+
+    def write(self, text):
+        """Add text to the current frame"""
+        if text:
+            self._frame.append(text)
+            self._page.append(text)
+            self.screens[-1].requests += 1
+            self._canvas = None
+
+    def print(self, *values, sep=" ", end="\n"):
+        """print() into the current frame"""
+        self.write(sep.join(map(str, values)) + end)
+
+    def flush(self):
+        """Send the current frame with a single write and flush"""
+        if not self._frame:
+            return
+        frame = "".join(self._frame)
+        self._frame = []
+        stream = self.stream or sys.stdout
+        stream.write(frame)
+        stream.flush()
+        stats = self.screens[-1]
+        stats.writes += 1
+        stats.bytes += len(frame.encode(getattr(stream, "encoding", None) or "utf-8", "replace"))
+
+    def sleep(self, seconds):
+        """End the frame, then wait until the next frame is due
+
+        A keypress during the wait makes every animation up to the next prompt
+        finish at once.
+        """
+        self.flush()
+        if self.skipping:
+            return
+        if self.keys is None:
+            self.clock.sleep(seconds)
+        elif self.clock.sleep(seconds, self.keys.wait):
+            self.skipping = True
+            self.clock.reset()
+
+    def input(self, prompt=""):
+        """End the frame, then wait for a line of input"""
+        self.write(prompt)
+        self.flush()
+        self.skipping = False
+        line = self.inputs()
+        self.clock.reset()
+        return line
+
+    def clear(self):
+        """Clear the terminal with an escape sequence
+
+        Terminals without ANSI support (see ansi.capabilities) fall back to
+        the system's clear command.
+        """
+        if self.headless or ansi.capabilities(self.stream).ansi:
+            self.write(CLEAR)
+        else:
+            self.flush()
+            os.system('cls' if os.name == 'nt' else 'clear')
+        self._page = []
+
+    def redraw(self, lines):
+        """Draw a block of lines over the one drawn by the previous redraw()
+
+        Only changed lines are rewritten. Any other output in between starts
+        a new block below it; without ANSI support every block is printed.
+        """
+        canvas = self._canvas
+        if canvas is None or not ansi.capabilities(self.stream).ansi:
+            canvas = ansi.Canvas()
+        self.write(canvas.update(lines))
+        self._canvas = canvas
+
+    def page(self):
+        """Return the text written since the last clear, i.e. the current screen"""
+        return "".join(self._page)
+
+    @property
+    def headless(self):
+        """True when running on a virtual clock"""
+        return isinstance(self.clock, VirtualClock)
+
+    def type_text(self, text, delay=0.03):
+        """Type text one character per delay, several per frame when behind"""
+        step = delay / self.clock.speed
+        if step <= 0:
+            self.print(text)
+            return
+        # Characters that always share a frame at this speed
+        minimum = int(-(-MIN_FRAME_INTERVAL / step // 1))  # ceil, without importing math
+        position = 0
+        while position < len(text):
+            if self.skipping:
+                count = len(text) - position
+            else:
+                count = max(minimum, 1 + int(self.clock.lag() / step))
+            self.write(text[position:position + count])
+            position += count
+            self.sleep(delay * count)
+        self.print()
+
+    def animate_dots(self, duration=2):
+        """Animate loading dots for duration cycles of one second"""
+        for _ in range(duration):
+            for dots in ['   ', '.  ', '.. ', '...']:
+                self.write(f'\r{dots}')
+                self.sleep(0.25)
+        self.print('\r   ')
+
+    def begin_screen(self, title):
+        """Start counting output for a new screen"""
+        self.flush()
+        self.screens.append(ScreenStats(title))
+
+    def report(self):
+        """Return a table of requested writes, actual writes and bytes per screen"""
+        lines = [f"{'SCREEN':<44} {'REQUESTED':>10} {'WRITES':>8} {'BYTES':>8}"]
+        for stats in self.screens:
+            if stats.requests:
+                lines.append(f"{stats.title[:44]:<44} {stats.requests:>10} "
+                             f"{stats.writes:>8} {stats.bytes:>8}")
+        total = [sum(getattr(s, field) for s in self.screens)
+                 for field in ("requests", "writes", "bytes")]
+        lines.append(f"{'TOTAL':<44} {total[0]:>10} {total[1]:>8} {total[2]:>8}")
+        return "\n".join(lines)
+
+def interactive_renderer(keys, stream=None, speed=1.0):
+    """Renderer for a terminal session whose animations a keypress can skip"""
+    return Renderer(stream, Clock(speed), keys.readline, keys)
+
+def headless_renderer(lines=(), stream=None, speed=1.0):
+    """Renderer that runs without sleeping or blocking, answering prompts from lines"""
+    return Renderer(stream, VirtualClock(speed), ScriptedInput(lines))
+
+def recording_renderer(speed=1.0):
+    """Headless renderer whose output and prompts are captured by a Recorder"""
+    clock = VirtualClock(speed)
+    recorder = Recorder(clock)
+    return Renderer(recorder, clock, recorder), recorder
@@ -0,0 +1,42 @@
+"""Records read through the .fai index translate like the streamed ones"""
+
+import os
+import tempfile
+import unittest
+
+import batch
+
+FASTA = (b">tx1 first record\nATGTTTGCTTAA\n"
+         b">tx3 desc [transl_table=2]\r\n"
+         b"ATGTTTGCTTCACCCCATTGTAGACCTTCACATGTTTCTGCGAGGGATGTT\nAAATGA\n"
+         b">tx4 [transl_table=11]\nGTGAAACCCTGAAAA\n")
+
+class IndexedRecordsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "t.fa")
+        with open(self.path, "wb") as handle:
+            handle.write(FASTA)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def output(self, **options):
+        path = os.path.join(self.directory.name, "out.fa")
+        batch.run(self.path, path, **options)
+        with open(path, "rb") as handle:
+            return handle.read()
+
+    def test_ids_match_streaming(self):
+        ids = ["tx1", "tx3", "tx4"]
+        for options in ({}, {"orfs": 1}):
+            self.assertEqual(self.output(ids=ids, **options), self.output(**options), options)
+
+    def test_tagged_record(self):
+        output = self.output(ids=["tx3"])
+        self.assertTrue(output.startswith(b">tx3 desc [transl_table=2]\n"), output)
+        self.assertIn(b"FASPHC*PSHVSA*DV", output)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+"""Indexing of irregular FASTA files"""
+
+import os
+import tempfile
+import unittest
+
+import faidx
+
+class IrregularFastaTest(unittest.TestCase):
+
+    def index(self, text):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "t.fa")
+            with open(path, "wb") as handle:
+                handle.write(text)
+            return faidx.build_index(path)
+
+    def test_blank_line_after_header(self):
+        with self.assertRaisesRegex(ValueError, "unequal lengths"):
+            self.index(b">a\n\nACGT\nAC\n")
+
+    def test_empty_record(self):
+        index = self.index(b">a\n\n>b\nAC\n")
+        self.assertEqual(index["a"].length, 0)
+        self.assertEqual(index["b"].length, 2)
+
+if __name__ == "__main__":
+    unittest.main()
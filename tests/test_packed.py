@@ -0,0 +1,65 @@
+"""Randomized parity of packed sequences with the str/bytes translation path"""
+
+import random
+import unittest
+
+import orf
+import packed
+import translation
+
+# Mostly ACGT, with some lowercase, RNA, N and IUPAC ambiguity codes
+ALPHABET = "ACGT" * 8 + "acgtU" + "NNRYKMSW"
+
+def random_sequence(rng, length):
+    return "".join(rng.choice(ALPHABET) for _ in range(length))
+
+class PackedParityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(21)
+
+    def sequences(self, count=300, longest=120):
+        """Random sequences, each as a str and as a packed view of a shared buffer"""
+        texts = [random_sequence(self.rng, self.rng.randint(0, longest)) for _ in range(count)]
+        return zip(texts, packed.pack_many(texts))
+
+    def test_decode(self):
+        for text, sequence in self.sequences():
+            self.assertEqual(str(sequence), text.upper().replace("T", "U"))
+
+    def test_translate(self):
+        codes = list(translation.CODES.values())
+        for text, sequence in self.sequences():
+            code = self.rng.choice(codes)
+            for frame in range(3):
+                for to_stop in (False, True):
+                    self.assertEqual(
+                        sequence.translate(frame, to_stop, code.table),
+                        translation.translate(text[frame:], to_stop, code.table),
+                        (text, frame, to_stop, code.id))
+
+    def test_slices_and_reverse_complement(self):
+        for text, sequence in self.sequences(100):
+            start = self.rng.randint(0, len(text))
+            end = self.rng.randint(start, len(text))
+            view = sequence[start:end]
+            self.assertEqual(view.translate(), translation.translate(text[start:end]))
+            self.assertEqual(view.reverse_complement().translate(),
+                             translation.translate(orf.reverse_complement(text[start:end])))
+
+    def test_find_orfs(self):
+        codes = list(translation.CODES.values())
+        for text, sequence in self.sequences(200, 400):
+            options = {
+                "min_length": self.rng.randint(0, 10),
+                "all_starts": self.rng.random() < 0.5,
+                "both_strands": self.rng.random() < 0.5,
+                "partial": self.rng.random() < 0.5,
+                "code": self.rng.choice(codes),
+                "alternative_starts": self.rng.random() < 0.3,
+            }
+            self.assertEqual(orf.find_orfs(sequence, **options), orf.find_orfs(text, **options),
+                             (text, options))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""User mRNA typed with spaces plays like the same bases without them, and
+quitting is reported apart from an interruption"""
+
+import io
+import unittest
+
+import playback
+import terminal
+import tutorial
+
+class WhitespaceTest(unittest.TestCase):
+
+    def tutorial_output(self, mrna):
+        stream = io.StringIO()
+        tutorial.Tutorial("en", terminal.headless_renderer(stream=stream), mrna).run()
+        return stream.getvalue()
+
+    def playback_output(self, mrna):
+        stream = io.StringIO()
+        playback.play(mrna, rate=100, screen=terminal.headless_renderer(stream=stream))
+        return stream.getvalue()
+
+    def test_tutorial(self):
+        output = self.tutorial_output("AUG UUU\tGCU\nGGU")
+        self.assertEqual(output, self.tutorial_output("AUGUUUGCUGGU"))
+        self.assertIn("Met-Phe-Ala-Gly", output)
+
+    def test_playback(self):
+        self.assertEqual(self.playback_output(" aug uuu gcu ggu uaa "),
+                         self.playback_output("AUGUUUGCUGGUUAA"))
+
+class QuitTest(unittest.TestCase):
+
+    def test_quit_is_not_an_interruption(self):
+        for language in ("en", "pt"):
+            stream = io.StringIO()
+            tour = tutorial.Tutorial(language, terminal.headless_renderer(["q"], stream))
+            tour.run()
+            self.assertIn(tour.text["quit"], stream.getvalue())
+            self.assertNotIn(tour.text["interrupted"], stream.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
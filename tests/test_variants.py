@@ -0,0 +1,89 @@
+"""Randomized parity of Transcript.effect with full re-translation of the edited sequence"""
+
+import random
+import unittest
+
+import translation
+import variants
+
+def random_bases(rng, length, alphabet="ACGT"):
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+def translate_to_stop(sequence, code):
+    """The protein of a coding sequence up to and including its first stop"""
+    protein = translation.translate(sequence, table=code.table)
+    stop = protein.find("*")
+    return protein if stop == -1 else protein[:stop + 1]
+
+class EffectParityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(25)
+        self.codes = list(translation.CODES.values())
+
+    def cases(self, count=5000):
+        """Random (transcript, variant, edited sequence) triples with UTRs on both sides"""
+        rng = self.rng
+        for _ in range(count):
+            utr5 = random_bases(rng, rng.randint(0, 6))
+            sequence = (utr5 + "ATG" + random_bases(rng, 3 * rng.randint(1, 30)) + "TAA"
+                        + random_bases(rng, rng.randint(0, 9), "ACGTN"))
+            transcript = variants.Transcript(sequence, len(utr5), rng.choice(self.codes))
+            position = rng.randrange(len(sequence))
+            ref = sequence[position:position + rng.choice((0, 1, 1, 1, 2, 3, 4, 6))]
+            alt = random_bases(rng, rng.choice((0, 1, 1, 1, 2, 3, 4, 6)))
+            if ref or alt:
+                edited = sequence[:position] + alt + sequence[position + len(ref):]
+                yield transcript, variants.Variant(position, ref, alt), edited
+
+    def test_protein_change(self):
+        """Splicing alt over ref in the reference protein gives the re-translated protein"""
+        for transcript, variant, edited in self.cases():
+            effect = transcript.effect(variant)
+            if effect.consequence in (variants.NONCODING, variants.START_LOST,
+                                      variants.FRAMESHIFT):
+                continue
+            first = effect.position - 1
+            spliced = (transcript.protein[:first] + effect.alt
+                       + transcript.protein[first + len(effect.ref):])
+            stop = spliced.find("*")
+            spliced = spliced if stop == -1 else spliced[:stop + 1]
+            expected = translate_to_stop(edited[transcript.start:], transcript.code)
+            snv = len(variant.ref) == len(variant.alt) == 1
+            if effect.consequence == variants.STOP_LOST and snv:
+                # An SNV only reports the amino acid replacing the stop, not the extension
+                expected = expected[:len(spliced)]
+            self.assertEqual(spliced, expected, (transcript.sequence, variant, effect))
+
+    def test_consequence(self):
+        """Consequences of SNVs and frameshifts match a comparison of whole proteins"""
+        for transcript, variant, edited in self.cases():
+            position, ref, alt = variant
+            effect = transcript.effect(variant)
+            if position + len(ref) <= transcript.start or position >= transcript.end:
+                self.assertEqual(effect.consequence, variants.NONCODING)
+                continue
+            if position < transcript.start:
+                self.assertEqual(effect.consequence, variants.START_LOST)
+                continue
+            if (len(alt) - len(ref)) % 3:
+                self.assertEqual(effect.consequence, variants.FRAMESHIFT)
+                continue
+            if len(ref) != 1 or len(alt) != 1:
+                continue
+            before = transcript.protein
+            after = translate_to_stop(edited[transcript.start:], transcript.code)
+            if after == before:
+                expected = variants.SYNONYMOUS
+            elif after[0] != before[0]:
+                expected = variants.START_LOST
+            elif len(after) < len(before) or (after.endswith("*") and not before.endswith("*")):
+                expected = variants.NONSENSE
+            elif before.endswith("*") and (len(after) > len(before) or not after.endswith("*")):
+                expected = variants.STOP_LOST
+            else:
+                expected = variants.MISSENSE
+            self.assertEqual(effect.consequence, expected, (transcript.sequence, variant))
+
+if __name__ == "__main__":
+    unittest.main()
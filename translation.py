@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Codon Translation Engine
+Converts arbitrary mRNA into protein using precomputed 64-entry codon tables,
+one for each NCBI genetic code
+"""
+
+from collections import namedtuple
+
+# Bases in the order used by the NCBI genetic code tables (U=0, C=1, A=2, G=3)
+BASES = "UCAG"
+
+# Standard genetic code, one amino acid per codon index (16*first + 4*second + third)
+STANDARD_CODE = "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG"
+
+# Every codon as RNA, by codon index
+CODONS = tuple(a + b + c for a in BASES for b in BASES for c in BASES)
+
+# Any codon containing a base outside ACGTU gets this bit set
+INVALID = 64
+
+THREE_LETTER = {
+    "A": "Ala", "R": "Arg", "N": "Asn", "D": "Asp", "C": "Cys",
+    "Q": "Gln", "E": "Glu", "G": "Gly", "H": "His", "I": "Ile",
+    "L": "Leu", "K": "Lys", "M": "Met", "F": "Phe", "P": "Pro",
+    "S": "Ser", "T": "Thr", "W": "Trp", "Y": "Tyr", "V": "Val",
+    "*": "Stop", "X": "Xaa",
+}
+
+def _base_table(weight):
+    """Build a bytes.translate table mapping each base to its weighted value"""
+    table = bytearray([INVALID] * 256)
+    for value, base in enumerate(BASES):
+        for char in (base, base.lower()):
+            table[ord(char)] = value * weight
+    table[ord("T")] = table[ord("t")] = table[ord("U")]
+    return bytes(table)
+
+_FIRST = _base_table(16)
+_SECOND = _base_table(4)
+_THIRD = _base_table(1)
+
+def compile_code(code):
+    """Compile a 64-letter genetic code into a 256-entry translate table"""
+    if len(code) != 64:
+        raise ValueError("a genetic code needs exactly 64 amino acids")
+    return (code + "X" * 192).encode("ascii")
+
+_STANDARD = compile_code(STANDARD_CODE)
+
+# NCBI translation tables as (id, name, amino acids, starts), both rows in the
+# codon order of STANDARD_CODE. In the starts row, M marks initiation codons
+# and * the codons that can end translation; in tables 27, 28 and 31 those
+# stops depend on context and read as amino acids otherwise
+NCBI_TABLES = (
+    (1, "Standard",
+     STANDARD_CODE,
+     "---M------**--*----M---------------M----------------------------"),
+    (2, "Vertebrate Mitochondrial",
+     "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG",
+     "----------**--------------------MMMM----------**---M------------"),
+    (3, "Yeast Mitochondrial",
+     "FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------**----------------------MM---------------M------------"),
+    (4, "Mold, Protozoan, and Coelenterate Mitochondrial and Mycoplasma/Spiroplasma",
+     "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "--MM------**-------M------------MMMM---------------M------------"),
+    (5, "Invertebrate Mitochondrial",
+     "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG",
+     "---M------**--------------------MMMM---------------M------------"),
+    (6, "Ciliate, Dasycladacean and Hexamita Nuclear",
+     "FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "--------------*--------------------M----------------------------"),
+    (9, "Echinoderm and Flatworm Mitochondrial",
+     "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+     "----------**-----------------------M---------------M------------"),
+    (10, "Euplotid Nuclear",
+     "FFLLSSSSYY**CCCWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------**-----------------------M----------------------------"),
+    (11, "Bacterial, Archaeal and Plant Plastid",
+     STANDARD_CODE,
+     "---M------**--*----M------------MMMM---------------M------------"),
+    (12, "Alternative Yeast Nuclear",
+     "FFLLSSSSYY**CC*WLLLSPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------**--*----M---------------M----------------------------"),
+    (13, "Ascidian Mitochondrial",
+     "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSGGVVVVAAAADDEEGGGG",
+     "---M------**----------------------MM---------------M------------"),
+    (14, "Alternative Flatworm Mitochondrial",
+     "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+     "-----------*-----------------------M----------------------------"),
+    (15, "Blepharisma Macronuclear",
+     "FFLLSSSSYY*QCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------*---*--------------------M----------------------------"),
+    (16, "Chlorophycean Mitochondrial",
+     "FFLLSSSSYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------*---*--------------------M----------------------------"),
+    (21, "Trematode Mitochondrial",
+     "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+     "----------**-----------------------M---------------M------------"),
+    (22, "Scenedesmus obliquus Mitochondrial",
+     "FFLLSS*SYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "------*---*---*--------------------M----------------------------"),
+    (23, "Thraustochytrium Mitochondrial",
+     "FF*LSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "--*-------**--*-----------------M--M---------------M------------"),
+    (24, "Rhabdopleuridae Mitochondrial",
+     "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+     "---M------**-------M---------------M---------------M------------"),
+    (25, "Candidate Division SR1 and Gracilibacteria",
+     "FFLLSSSSYY**CCGWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "---M------**-----------------------M---------------M------------"),
+    (26, "Pachysolen tannophilus Nuclear",
+     "FFLLSSSSYY**CC*WLLLAPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------**--*----M---------------M----------------------------"),
+    (27, "Karyorelict Nuclear",
+     "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "--------------*--------------------M----------------------------"),
+    (28, "Condylostoma Nuclear",
+     "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------**--*--------------------M----------------------------"),
+    (29, "Mesodinium Nuclear",
+     "FFLLSSSSYYYYCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "--------------*--------------------M----------------------------"),
+    (30, "Peritrich Nuclear",
+     "FFLLSSSSYYEECC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "--------------*--------------------M----------------------------"),
+    (31, "Blastocrithidia Nuclear",
+     "FFLLSSSSYYEECCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "----------**-----------------------M----------------------------"),
+    (32, "Balanophoraceae Plastid",
+     "FFLLSSSSYY*WCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+     "---M------*---*----M------------MMMM---------------M------------"),
+    (33, "Cephalodiscidae Mitochondrial",
+     "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+     "---M-------*-------M---------------M---------------M------------"),
+)
+
+# A compiled genetic code: table is the translate table of its amino acids;
+# start_table also writes the initiation codons in lowercase, for ORF
+# finders; starts/stops have bit i set when codon index i can start/end
+# translation
+GeneticCode = namedtuple("GeneticCode", "id name amino_acids table start_table starts stops")
+
+def _mask(row, marks):
+    """64-bit mask of the codon indexes whose letter in a 64-letter row is in marks"""
+    return sum(1 << index for index, char in enumerate(row) if char in marks)
+
+def _compile_ncbi(table_id, name, amino_acids, starts):
+    """Compile one row of NCBI_TABLES"""
+    start_mask = _mask(starts, "M")
+    marked = "".join(aa.lower() if start_mask >> index & 1 else aa
+                     for index, aa in enumerate(amino_acids))
+    return GeneticCode(table_id, name, amino_acids, compile_code(amino_acids),
+                       compile_code(marked), start_mask,
+                       _mask(amino_acids, "*") | _mask(starts, "*"))
+
+# The default of every function taking a code; the others are compiled into
+# CODES when first used rather than on `import translation`
+STANDARD = _compile_ncbi(*NCBI_TABLES[0])
+
+def _compile_codes():
+    """Every NCBI genetic code, compiled once: switching codes only switches tables"""
+    global CODES
+    CODES = {row[0]: STANDARD if row[0] == STANDARD.id else _compile_ncbi(*row)
+             for row in NCBI_TABLES}
+    return CODES
+
+def __getattr__(name):
+    """translation.CODES, compiled on first access"""
+    if name == "CODES":
+        return _compile_codes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def genetic_code(table_id):
+    """Return the compiled NCBI genetic code with this table number"""
+    codes = globals().get("CODES") or _compile_codes()
+    try:
+        return codes[int(table_id)]
+    except (KeyError, ValueError, TypeError):
+        raise ValueError(f"unknown genetic code {table_id!r} "
+                         f"(NCBI tables: {', '.join(map(str, codes))})") from None
+
+def code_option(value):
+    """argparse type of the --code options: the genetic code of an NCBI table number"""
+    try:
+        return genetic_code(value)
+    except ValueError as error:
+        import argparse  # only needed by the command lines
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+def codons_in(mask):
+    """The codons (as RNA) whose bits are set in a 64-bit codon mask, in index order"""
+    return [codon for index, codon in enumerate(CODONS) if mask >> index & 1]
+
+def _as_bytes(sequence):
+    """Return the sequence as ASCII bytes (unknown characters become N)"""
+    if isinstance(sequence, str):
+        return sequence.encode("ascii", "replace")
+    return bytes(sequence)
+
+def encode_codons(sequence):
+    """Encode a nucleotide sequence as one byte per codon (0-63, >=64 if invalid)"""
+    if hasattr(sequence, "codons"):
+        # Packed sequences (packed.PackedSequence) cut codons out of their 2-bit form
+        return sequence.codons()
+    seq = _as_bytes(sequence)
+    count = len(seq) // 3
+    if not count:
+        return b""
+    end = count * 3
+    # Each reading position is mapped with bytes.translate and the three
+    # streams are merged with a single big-integer OR, so no Python-level
+    # loop ever runs per codon.
+    first = int.from_bytes(seq[0:end:3].translate(_FIRST), "big")
+    second = int.from_bytes(seq[1:end:3].translate(_SECOND), "big")
+    third = int.from_bytes(seq[2:end:3].translate(_THIRD), "big")
+    return (first | second | third).to_bytes(count, "big")
+
+def translate(sequence, to_stop=False, table=_STANDARD):
+    """Translate mRNA (or DNA) into a one-letter protein sequence"""
+    protein = encode_codons(sequence).translate(table).decode("ascii")
+    if to_stop:
+        stop = protein.find("*")
+        if stop != -1:
+            protein = protein[:stop]
+    return protein
+
+def normalize(sequence):
+    """Return the sequence as uppercase RNA without whitespace"""
+    return "".join(sequence.split()).upper().replace("T", "U")
+
+def split_codons(sequence):
+    """Split a sequence into its complete codons"""
+    seq = normalize(sequence)
+    return [seq[i:i + 3] for i in range(0, len(seq) - 2, 3)]
+
+def three_letter(protein):
+    """Convert a one-letter protein sequence into three-letter names"""
+    return [THREE_LETTER.get(aa, "Xaa") for aa in protein]
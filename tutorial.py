@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+"""
+Tutorial Scene Engine
+Plays the data-driven scene graph of the tutorial in any available language
+"""
+
+import os
+import sys
+from collections import deque, namedtuple
+
+import catalog
+import diagram
+import terminal
+import translation
+
+DEFAULT_LOCALE = "en"
+
+# Coding sequence replayed by the elongation animation (Met-Phe-Ala-Gly)
+DEFAULT_MRNA = "AUGUUUGCUGGU"
+
+# Seconds per character of the typing animation
+DEFAULT_DELAY = 0.03
+
+WIDTH = 80
+
+# Columns for the growing peptide in the elongation cycle; longer chains
+# scroll so that only their newest residues are shown
+PEPTIDE_WINDOW = 27
+
+# Where an interactive session records the scene it is showing, for --resume
+CHECKPOINT = os.path.join(os.path.expanduser("~"), ".mrna2protein-checkpoint")
+
+# A scene is a key plus a tuple of steps. Each step is an operation followed
+# by its arguments; text arguments are keys into the locale catalog, and the
+# texts may use {fields} filled in by the "codons" step:
+#   ("header", key)         clear the screen and print a title banner
+#   ("type", key[, delay])  print text with the typing animation
+#   ("print", key)          print text at once
+#   ("rule", char)          print a full-width horizontal rule
+#   ("sleep", seconds)      pause the animation
+#   ("dots", cycles)        animate loading dots
+#   ("wait", key)           type a prompt and wait for ENTER
+#   ("codons", steps)       play steps once per codon of the mRNA, with
+#                           {number} {codon} {aa} {prev_codon} {prev_aa} {peptide}
+Scene = namedtuple("Scene", "key steps")
+
+SCENES = (
+    Scene("introduction", (
+        ("header", "introduction.title"),
+        ("type", "introduction.1"),
+        ("sleep", 0.5),
+        ("type", "introduction.2"),
+        ("type", "introduction.3"),
+        ("sleep", 1),
+        ("wait", "introduction.4"),
+    )),
+    Scene("central_dogma", (
+        ("header", "central_dogma.title"),
+        ("type", "central_dogma.1"),
+        ("sleep", 1),
+        ("print", "central_dogma.2"),
+        ("sleep", 2),
+        ("type", "central_dogma.3"),
+        ("type", "central_dogma.4"),
+        ("wait", "central_dogma.5"),
+    )),
+    Scene("machinery", (
+        ("header", "machinery.title"),
+        ("type", "machinery.1"),
+        ("sleep", 1),
+        ("print", "machinery.2"),
+        ("type", "machinery.3", 0.02),
+        ("sleep", 0.5),
+        ("print", "machinery.4"),
+        ("type", "machinery.5", 0.02),
+        ("sleep", 0.5),
+        ("print", "machinery.6"),
+        ("type", "machinery.7", 0.02),
+        ("sleep", 0.5),
+        ("print", "machinery.8"),
+        ("type", "machinery.9", 0.02),
+        ("sleep", 0.5),
+        ("print", "machinery.10"),
+        ("type", "machinery.11", 0.02),
+        ("sleep", 0.5),
+        ("print", "machinery.12"),
+        ("type", "machinery.13", 0.02),
+        ("sleep", 0.5),
+        ("print", "machinery.14"),
+        ("type", "machinery.15", 0.02),
+        ("sleep", 0.5),
+        ("print", "machinery.16"),
+        ("wait", "machinery.17"),
+    )),
+    Scene("initiation", (
+        ("header", "initiation.title"),
+        ("type", "initiation.1"),
+        ("type", "initiation.2"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "initiation.3", 0.02),
+        ("dots", 1),
+        ("print", "initiation.4"),
+        ("type", "initiation.5"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "initiation.6", 0.02),
+        ("dots", 1),
+        ("print", "initiation.7"),
+        ("type", "initiation.8"),
+        ("type", "initiation.9"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "initiation.10", 0.02),
+        ("dots", 1),
+        ("print", "initiation.11"),
+        ("type", "initiation.12"),
+        ("type", "initiation.13"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "initiation.14", 0.02),
+        ("dots", 1),
+        ("print", "initiation.15"),
+        ("type", "initiation.16"),
+        ("type", "initiation.17"),
+        ("type", "initiation.18"),
+        ("type", "initiation.19"),
+        ("sleep", 2),
+        ("type", "initiation.20"),
+        ("wait", "initiation.21"),
+    )),
+    Scene("elongation", (
+        ("header", "elongation.title"),
+        ("type", "elongation.1"),
+        ("type", "elongation.2"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "elongation.3", 0.02),
+        ("print", "elongation.4"),
+        ("sleep", 1),
+        ("codons", (
+            ("rule", "═"),
+            ("type", "elongation.5", 0.02),
+            ("dots", 1),
+            ("rule", "─"),
+            ("type", "elongation.6", 0.02),
+            ("sleep", 0.5),
+            ("print", "elongation.7"),
+            ("type", "elongation.8"),
+            ("type", "elongation.9"),
+            ("sleep", 1),
+            ("rule", "─"),
+            ("type", "elongation.10", 0.02),
+            ("sleep", 0.5),
+            ("print", "elongation.11"),
+            ("type", "elongation.12"),
+            ("type", "elongation.13"),
+            ("sleep", 1),
+            ("rule", "─"),
+            ("type", "elongation.14", 0.02),
+            ("sleep", 0.5),
+            ("print", "elongation.15"),
+            ("type", "elongation.16"),
+            ("type", "elongation.17"),
+            ("type", "elongation.18"),
+            ("type", "elongation.19"),
+            ("sleep", 1),
+            ("print", "elongation.20"),
+            ("sleep", 1),
+        )),
+        ("rule", "═"),
+        ("type", "elongation.21"),
+        ("type", "elongation.22"),
+        ("type", "elongation.23"),
+        ("wait", "elongation.24"),
+    )),
+    Scene("termination", (
+        ("header", "termination.title"),
+        ("type", "termination.1"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "termination.2", 0.02),
+        ("dots", 1),
+        ("print", "termination.3"),
+        ("type", "termination.4"),
+        ("type", "termination.5"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "termination.6", 0.02),
+        ("dots", 1),
+        ("print", "termination.7"),
+        ("type", "termination.8"),
+        ("type", "termination.9"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "termination.10", 0.02),
+        ("dots", 1),
+        ("print", "termination.11"),
+        ("type", "termination.12"),
+        ("type", "termination.13"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "termination.14", 0.02),
+        ("dots", 1),
+        ("print", "termination.15"),
+        ("type", "termination.16"),
+        ("type", "termination.17"),
+        ("type", "termination.18"),
+        ("sleep", 1),
+        ("rule", "═"),
+        ("type", "termination.19"),
+        ("type", "termination.20"),
+        ("wait", "termination.21"),
+    )),
+    Scene("folding", (
+        ("header", "folding.title"),
+        ("type", "folding.1"),
+        ("sleep", 1),
+        ("print", "folding.2"),
+        ("dots", 2),
+        ("print", "folding.3"),
+        ("dots", 2),
+        ("print", "folding.4"),
+        ("type", "folding.5"),
+        ("type", "folding.6"),
+        ("type", "folding.7"),
+        ("print", "folding.8"),
+        ("sleep", 2),
+        ("wait", "folding.9"),
+    )),
+    Scene("summary", (
+        ("header", "summary.title"),
+        ("type", "summary.1"),
+        ("sleep", 1),
+        ("print", "summary.2"),
+        ("sleep", 2),
+        ("type", "summary.3"),
+        ("type", "summary.4"),
+        ("type", "summary.5"),
+        ("wait", "summary.6"),
+    )),
+    Scene("clinical", (
+        ("header", "clinical.title"),
+        ("type", "clinical.1"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "clinical.2", 0.02),
+        ("print", "clinical.3"),
+        ("sleep", 0.3),
+        ("print", "clinical.4"),
+        ("sleep", 0.3),
+        ("print", "clinical.5"),
+        ("sleep", 0.3),
+        ("print", "clinical.6"),
+        ("sleep", 0.3),
+        ("sleep", 0.5),
+        ("rule", "─"),
+        ("type", "clinical.7", 0.02),
+        ("print", "clinical.8"),
+        ("sleep", 0.3),
+        ("print", "clinical.9"),
+        ("sleep", 0.3),
+        ("print", "clinical.10"),
+        ("sleep", 0.3),
+        ("print", "clinical.11"),
+        ("sleep", 0.3),
+        ("sleep", 0.5),
+        ("rule", "─"),
+        ("type", "clinical.12", 0.02),
+        ("print", "clinical.13"),
+        ("sleep", 0.3),
+        ("print", "clinical.14"),
+        ("sleep", 0.3),
+        ("print", "clinical.15"),
+        ("sleep", 0.3),
+        ("sleep", 0.5),
+        ("rule", "─"),
+        ("type", "clinical.16", 0.02),
+        ("print", "clinical.17"),
+        ("sleep", 0.3),
+        ("print", "clinical.18"),
+        ("sleep", 0.3),
+        ("print", "clinical.19"),
+        ("sleep", 0.3),
+        ("sleep", 0.5),
+        ("rule", "═"),
+        ("type", "clinical.20", 0.02),
+        ("print", "clinical.21"),
+        ("sleep", 2),
+        ("wait", "clinical.22"),
+    )),
+    Scene("research", (
+        ("header", "research.title"),
+        ("type", "research.1"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "research.2", 0.02),
+        ("print", "research.3"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "research.4", 0.02),
+        ("print", "research.5"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "research.6", 0.02),
+        ("print", "research.7"),
+        ("sleep", 1),
+        ("rule", "─"),
+        ("type", "research.8", 0.02),
+        ("print", "research.9"),
+        ("sleep", 1),
+        ("wait", "research.10"),
+    )),
+    Scene("conclusion", (
+        ("header", "conclusion.title"),
+        ("type", "conclusion.1"),
+        ("sleep", 1),
+        ("print", "conclusion.2"),
+        ("type", "conclusion.3"),
+        ("print", "conclusion.4"),
+        ("sleep", 2),
+        ("rule", "═"),
+        ("type", "conclusion.5", 0.02),
+        ("print", "conclusion.6"),
+        ("sleep", 1),
+        ("rule", "═"),
+        ("type", "conclusion.7"),
+        ("type", "conclusion.8"),
+        ("print", "conclusion.9"),
+    )),
+)
+
+# Scene key -> position in SCENES
+INDEX = {scene.key: number for number, scene in enumerate(SCENES)}
+
+def find_scene(name):
+    """Return the position of a scene given its number (from 1) or key, or None"""
+    name = name.strip().lower()
+    if name.isdigit():
+        number = int(name) - 1
+        return number if 0 <= number < len(SCENES) else None
+    return INDEX.get(name)
+
+def load_checkpoint(path):
+    """Return the position of the scene stored in a checkpoint (0 if there is none)"""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return INDEX.get(handle.read().strip(), 0)
+    except OSError:
+        return 0
+
+def save_checkpoint(path, key):
+    """Record the current scene; a checkpoint that can't be written is skipped"""
+    try:
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(key + "\n")
+        os.replace(temporary, path)
+    except OSError:
+        pass
+
+class Peptide:
+    """Growing peptide chain, shown through a fixed-width window on its newest residues
+
+    append() and str() cost O(window), however long the chain gets.
+    """
+
+    def __init__(self, width=PEPTIDE_WINDOW):
+        self.width = width
+        self.length = 0
+        self._window = deque()
+        self._chars = 0  # len("-".join(self._window))
+
+    def append(self, residue):
+        """Add a residue and scroll the window if it no longer fits"""
+        self.length += 1
+        self._window.append(residue)
+        self._chars += len(residue) + (len(self._window) > 1)
+        # Hidden residues are marked with "…-", which needs two columns
+        while len(self._window) > 1 and self._chars + 2 * (self.length > len(self._window)) > self.width:
+            self._chars -= len(self._window.popleft()) + 1
+
+    def __str__(self):
+        visible = "-".join(self._window)
+        return visible if self.length == len(self._window) else "…-" + visible
+
+class Tutorial:
+    """Plays scenes with the strings of one locale on one renderer"""
+
+    def __init__(self, locale=DEFAULT_LOCALE, screen=None, mrna=DEFAULT_MRNA,
+                 checkpoint=None, code=translation.STANDARD):
+        self.locale = locale
+        self.text = catalog.load(locale)
+        self.screen = screen or terminal.Renderer()
+        self.mrna = mrna
+        self.checkpoint = checkpoint
+        self.code = code
+        self.fields = self._code_fields()  # filled into the texts of every scene
+        self.frames = {}  # scene key -> final screen of its first complete view
+
+    def _code_fields(self):
+        """The {stop_codons} and {stop_entry} fields of the texts, for the genetic code
+
+        These are the codons the code translates as stops. Codes that have
+        none (27, 28 and 31) read their stop codons as amino acids except
+        near the end of the mRNA, which the fields then say.
+        """
+        stops = [codon for codon, amino_acid in zip(translation.CODONS, self.code.amino_acids)
+                 if amino_acid == "*"]
+        context = not stops
+        if context:
+            stops = translation.codons_in(self.code.stops)
+        listed = ", ".join(stops[:-1]) + self.text["code.last_separator"] + stops[-1]
+        listed = listed if len(stops) > 1 else stops[0]
+        entry = ", ".join(stops)
+        if context:
+            listed = self._format("code.context_stop", {"codons": listed})
+            entry = self._format("code.context_stop", {"codons": entry})
+        return {
+            "stop_codons": listed,
+            "stop_entry": self._format("code.stop_entry", {"codons": entry}),
+        }
+
+    def play(self, scene):
+        """Play one scene and return the answer to its last prompt (None if it has none)
+
+        The first view is animated; later views redraw the final frame at once.
+        """
+        frame = self.frames.get(scene.key)
+        if frame is None:
+            answer = self._run(scene.steps, dict(self.fields))
+            self.frames[scene.key] = self.screen.page()
+            return answer
+        self.screen.begin_screen(self._format(scene.key + ".title", {}))
+        self.screen.clear()
+        self.screen.write(frame)
+        if scene.steps[-1][0] == "wait":
+            return self.screen.input()
+        self.screen.flush()
+        return None
+
+    def run(self, start=0):
+        """Play the scenes from start, following the navigation commands typed at
+        each scene's last prompt; Ctrl+C ends the tutorial politely"""
+        number = start
+        try:
+            while number is not None and number < len(SCENES):
+                scene = SCENES[number]
+                if self.checkpoint:
+                    save_checkpoint(self.checkpoint, scene.key)
+                number = self._navigate(number, self.play(scene))
+            if number is None:
+                self.screen.print(self.text["quit"])
+        except KeyboardInterrupt:
+            self.screen.print(self.text["interrupted"])
+            sys.exit(0)
+        finally:
+            self.screen.flush()
+
+    def _navigate(self, number, answer):
+        """Return the scene to show after scene number, or None to quit"""
+        while answer is not None:
+            command = answer.strip().lower()
+            if command in ("", "n", "next"):
+                break
+            if command in ("b", "back"):
+                return max(number - 1, 0)
+            if command in ("q", "quit"):
+                return None
+            target = find_scene(command)
+            if target is not None:
+                return target
+            if command in ("l", "list"):
+                for position, scene in enumerate(SCENES, 1):
+                    self.screen.print(self.text["nav.scene"].format(
+                        number=position, key=scene.key, title=self.text[scene.key + ".title"]))
+            else:
+                self.screen.print(self.text["nav.help"])
+            answer = self.screen.input()
+        return number + 1
+
+    def _run(self, steps, context):
+        """Execute a sequence of steps and return the result of the last one"""
+        result = None
+        for operation, *arguments in steps:
+            result = getattr(self, "_" + operation)(context, *arguments)
+        return result
+
+    def _format(self, key, context):
+        """Look up a catalog text and fill in its fields"""
+        return diagram.render(self.text[key], context)
+
+    def _header(self, context, key):
+        title = self._format(key, context)
+        self.screen.begin_screen(title)
+        self.screen.clear()
+        self.screen.print("=" * WIDTH)
+        self.screen.print(title.center(WIDTH))
+        self.screen.print("=" * WIDTH)
+        self.screen.print()
+
+    def _type(self, context, key, delay=DEFAULT_DELAY):
+        self.screen.type_text(self._format(key, context), delay)
+
+    def _print(self, context, key):
+        self.screen.print(self._format(key, context))
+
+    def _rule(self, context, char):
+        self.screen.print("\n" + char * WIDTH)
+
+    def _sleep(self, context, seconds):
+        self.screen.sleep(seconds)
+
+    def _dots(self, context, cycles):
+        self.screen.animate_dots(cycles)
+
+    def _wait(self, context, key):
+        self._type(context, key)
+        return self.screen.input()
+
+    def _codons(self, context, steps):
+        # split_codons() drops whitespace, so translate the same normalized bases
+        mrna = translation.normalize(self.mrna)
+        protein = translation.translate(mrna, to_stop=True, table=self.code.table)
+        amino_acids = translation.three_letter(protein)
+        codons = translation.split_codons(mrna)[:len(amino_acids)]
+        peptide = Peptide()
+        for i, (aa, codon) in enumerate(zip(amino_acids, codons)):
+            peptide.append(aa)
+            context.update(
+                number=i + 1,
+                aa=aa,
+                codon=codon,
+                prev_codon=codons[i - 1] if i > 0 else "───",
+                prev_aa=amino_acids[i - 1] if i > 0 else "   ",
+                peptide=str(peptide),
+            )
+            self._run(steps, context)
+        context["peptide"] = "-".join(amino_acids)
+
+def _scene_option(name):
+    """argparse type for --scene"""
+    number = find_scene(name)
+    if number is None:
+        import argparse
+        raise argparse.ArgumentTypeError(f"unknown scene {name!r}")
+    return number
+
+def parse_args(argv=None, locale=DEFAULT_LOCALE):
+    """Parse the command-line options, with help texts in the given locale"""
+    import argparse  # only needed by the command line, not by `import tutorial`
+    text = catalog.load(locale)
+    parser = argparse.ArgumentParser(description=text["cli.description"])
+    parser.add_argument("mrna", nargs="?", default=DEFAULT_MRNA, help=text["cli.mrna"])
+    parser.add_argument("--lang", default=locale, choices=catalog.available(),
+                        help=text["cli.lang"])
+    parser.add_argument("--speed", "--velocidade", type=float, default=1.0,
+                        help=text["cli.speed"])
+    parser.add_argument("--headless", "--sem-interface", action="store_true",
+                        help=text["cli.headless"])
+    parser.add_argument("--render-stats", "--estatisticas", action="store_true",
+                        help=text["cli.render_stats"])
+    parser.add_argument("--scene", "--cena", type=_scene_option, metavar="SCENE",
+                        help=text["cli.scene"])
+    parser.add_argument("--resume", "--continuar", action="store_true", help=text["cli.resume"])
+    parser.add_argument("--checkpoint", "--progresso", metavar="PATH",
+                        help=text["cli.checkpoint"])
+    parser.add_argument("--fasta", metavar="PATH", help=text["cli.fasta"])
+    parser.add_argument("--code", "--codigo", type=translation.code_option,
+                        default=translation.STANDARD, metavar="N", help=text["cli.code"])
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error(text["cli.bad_speed"])
+    if args.fasta:
+        # The mrna argument names a transcript of the indexed FASTA file
+        import faidx
+        try:
+            with faidx.IndexedFasta(args.fasta) as reference:
+                args.mrna = reference.fetch(args.mrna).decode("ascii", "replace")
+        except KeyError:
+            parser.error(text["cli.unknown_id"].format(name=args.mrna, path=args.fasta))
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+    return args
+
+def main(locale=DEFAULT_LOCALE, argv=None):
+    """Run the tutorial from the command line"""
+    args = parse_args(argv, locale)
+    if args.headless:
+        _main(args, terminal.headless_renderer(speed=args.speed))
+    else:
+        with terminal.Keyboard() as keys:
+            _main(args, terminal.interactive_renderer(keys, speed=args.speed))
+
+def _main(args, screen):
+    """Play the tutorial selected by the command-line options on screen"""
+    # Headless runs only keep a checkpoint when asked to
+    checkpoint = args.checkpoint or (None if args.headless else CHECKPOINT)
+    tutorial = Tutorial(args.lang, screen, args.mrna, checkpoint, args.code)
+    start = args.scene or 0
+    if args.resume and checkpoint:
+        start = load_checkpoint(checkpoint)
+    try:
+        tutorial.run(start)
+    finally:
+        if args.render_stats:
+            print(screen.report(), file=sys.stderr)
+        if args.headless:
+            print(tutorial.text["cli.headless_summary"].format(
+                seconds=screen.clock.now, prompts=screen.inputs.count), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
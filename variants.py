@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Variant Effects
+Applies SNVs and indels to coding sequences and re-translates only the codons
+they touch, reusing the reference translation of each transcript
+"""
+
+import argparse
+import contextlib
+import sys
+from collections import namedtuple
+
+import faidx
+import orf
+import translation
+
+SYNONYMOUS = "synonymous"
+MISSENSE = "missense"
+NONSENSE = "nonsense"
+FRAMESHIFT = "frameshift"
+INFRAME_INSERTION = "inframe_insertion"
+INFRAME_DELETION = "inframe_deletion"
+START_LOST = "start_lost"
+STOP_LOST = "stop_lost"
+NONCODING = "noncoding"  # outside the coding sequence (UTRs)
+
+# position is 0-based on the transcript; ref and alt are the replaced and
+# replacing bases (either may be empty for a pure insertion or deletion)
+Variant = namedtuple("Variant", "position ref alt")
+
+# position: 1-based number of the first codon the variant touches (0 for
+# noncoding variants); ref/alt: the amino acids of the touched codons before
+# and after the change (for frameshifts, only the first codon)
+Effect = namedtuple("Effect", "variant consequence position ref alt")
+
+# Shift of each position of a codon within its codon index (16*first + 4*second + third)
+_SHIFTS = (4, 2, 0)
+
+class Transcript:
+    """A coding sequence with its reference translation, ready to apply variants to
+
+    The reference is translated once, from start (0-based) to its first
+    stop codon, and kept both as amino acids and as codon indexes, so an
+    SNV costs a few integer operations and an indel one short translation.
+    """
+
+    __slots__ = ("name", "sequence", "start", "end", "code", "protein", "codons")
+
+    def __init__(self, sequence, start=0, code=translation.STANDARD, name=""):
+        self.name = name
+        self.sequence = orf.as_dna(sequence)
+        self.start = start
+        self.code = code
+        protein = translation.translate(self.sequence[start:], table=code.table)
+        stop = protein.find("*")
+        self.protein = protein if stop == -1 else protein[:stop + 1]
+        self.end = start + 3 * len(self.protein)
+        self.codons = translation.encode_codons(self.sequence[start:self.end])
+
+    def effect(self, variant):
+        """Return the Effect of one Variant; ValueError if its ref does not match"""
+        position, ref, alt = variant
+        ref = orf.as_dna(ref)
+        alt = orf.as_dna(alt)
+        end = position + len(ref)
+        if position < 0 or end > len(self.sequence) or self.sequence[position:end] != ref:
+            raise ValueError(f"reference mismatch: {self.name or 'transcript'}:{position + 1} "
+                             f"is not {ref.decode('ascii', 'replace') or '-'}")
+        if end <= self.start or position >= self.end:
+            return Effect(variant, NONCODING, 0, "", "")
+        if position < self.start:
+            # Spans the 5' UTR and the start codon
+            return Effect(variant, START_LOST, 1, self.protein[:1], "")
+        first = (position - self.start) // 3
+        if len(ref) == 1 and len(alt) == 1:
+            return self._substitution(variant, first, (position - self.start) % 3, alt)
+        return self._indel(variant, first, position, end, alt)
+
+    def _substitution(self, variant, number, phase, base):
+        """Effect of an SNV, by editing the reference codon index in place"""
+        old = self.codons[number]
+        value = translation._THIRD[base[0]]
+        if old >= translation.INVALID:
+            # The codon has an ambiguous base, which the SNV may replace
+            first = self.start + 3 * number
+            codon = self.sequence[first:first + 3]
+            new = translation.encode_codons(codon[:phase] + base + codon[phase + 1:])[0]
+        elif value >= translation.INVALID:
+            new = translation.INVALID
+        else:
+            shift = _SHIFTS[phase]
+            new = old & ~(3 << shift) | value << shift
+        ref = self.protein[number]
+        alt = chr(self.code.table[new])
+        return Effect(variant, _classify(number, ref, alt, 0), number + 1, ref, alt)
+
+    def _indel(self, variant, number, position, end, alt):
+        """Effect of any other change, by translating the codons it touches"""
+        window_start = self.start + 3 * number
+        # Codons from the first touched one to the one holding the last
+        # replaced base (or the base after an insertion)
+        last = (max(end, position + 1) - 1 - self.start) // 3
+        window_end = self.start + 3 * (last + 1)
+        edited = (self.sequence[window_start:position] + alt +
+                  self.sequence[end:max(window_end, end)])
+        delta = len(alt) - (end - position)
+        reaches_stop = window_end >= self.end
+        if reaches_stop:
+            # Read on into the 3' UTR, up to the first stop codon after the change
+            ref = self.protein[number:]
+            edited += self.sequence[max(window_end, end):]
+        else:
+            ref = self.protein[number:last + 1]
+        if delta % 3:
+            alt_protein = translation.translate(edited[:3], table=self.code.table)
+            return Effect(variant, FRAMESHIFT, number + 1, ref[:1], alt_protein)
+        alt_protein = translation.translate(edited, table=self.code.table)
+        if reaches_stop and "*" in alt_protein:
+            alt_protein = alt_protein[:alt_protein.find("*") + 1]
+        consequence = _classify(number, ref, alt_protein, delta)
+        return Effect(variant, consequence, *_trim(number + 1, ref, alt_protein))
+
+    def effects(self, variants):
+        """Yield the Effect of each Variant against this reference"""
+        return map(self.effect, variants)
+
+def _trim(position, ref, alt):
+    """Drop the residues shared by both ends of ref and alt (e.g. of the anchor base
+    of VCF indels), so only the changed ones are reported"""
+    if ref == alt:
+        return position, ref, alt
+    prefix = 0
+    while prefix < len(ref) and prefix < len(alt) and ref[prefix] == alt[prefix]:
+        prefix += 1
+    suffix = 0
+    while (suffix < len(ref) - prefix and suffix < len(alt) - prefix
+           and ref[-1 - suffix] == alt[-1 - suffix]):
+        suffix += 1
+    return position + prefix, ref[prefix:len(ref) - suffix], alt[prefix:len(alt) - suffix]
+
+def _classify(number, ref, alt, delta):
+    """Consequence of replacing the amino acids ref, from codon number (0-based), by alt
+
+    delta is the change in length, in bases, of an in-frame variant.
+    """
+    if number == 0 and alt[:1] != ref[:1]:
+        return START_LOST
+    stop = alt.find("*")
+    reference_stop = ref.find("*")
+    if reference_stop != -1:
+        if alt[:reference_stop + 1] == ref[:reference_stop + 1]:
+            return SYNONYMOUS  # only the 3' UTR after the stop codon changes
+        # Where the reference stop codon lands once the variant is applied
+        expected = reference_stop + delta // 3
+        if stop == -1 or stop > expected:
+            return STOP_LOST
+        if stop < expected:
+            return NONSENSE
+    elif stop != -1:
+        return NONSENSE
+    if delta > 0:
+        return INFRAME_INSERTION
+    if delta < 0:
+        return INFRAME_DELETION
+    return SYNONYMOUS if alt == ref else MISSENSE
+
+def protein_change(effect):
+    """Short HGVS-style description of an Effect, e.g. R97W, R97=, R97fs or K5_L6del"""
+    position, ref, alt = effect.position, effect.ref, effect.alt
+    if effect.consequence == NONCODING:
+        return "."
+    if effect.consequence == START_LOST:
+        return f"{ref[:1]}1?"
+    if not ref:  # between the residues position - 1 and position
+        return f"{position - 1}_{position}ins{alt}"
+    first = ref[0] + str(position)
+    if effect.consequence == FRAMESHIFT:
+        return first + "fs"
+    if ref == alt:
+        return first + "="
+    if len(ref) == 1 and len(alt) == 1:
+        return first + alt
+    last = f"_{ref[-1]}{position + len(ref) - 1}" if len(ref) > 1 else ""
+    return f"{first}{last}{'delins' + alt if alt else 'del'}"
+
+class TranscriptSet:
+    """Transcripts of an indexed FASTA file, each loaded once, when first used"""
+
+    def __init__(self, path, code=translation.STANDARD):
+        self.reference = faidx.IndexedFasta(path)
+        self.code = code
+        self._loaded = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.reference.close()
+
+    def __contains__(self, name):
+        return name in self._loaded or name in self.reference
+
+    def __getitem__(self, name):
+        """The Transcript of a record name; KeyError for unknown names"""
+        transcript = self._loaded.get(name)
+        if transcript is None:
+            transcript = self._loaded[name] = Transcript(self.reference.fetch(name),
+                                                         code=self.code, name=name)
+        return transcript
+
+def read_vcf(handle):
+    """Yield (name, Variant) pairs from VCF lines: CHROM is the transcript, POS 1-based
+
+    Every comma-separated ALT allele is a variant of its own; "." and "-"
+    stand for an empty allele.
+    """
+    for line in handle:
+        if line.startswith("#") or not line.strip():
+            continue
+        columns = line.rstrip("\n").split("\t")
+        if len(columns) < 5 or not columns[1].isdigit():
+            raise ValueError(f"malformed VCF line: {line[:60]!r}")
+        name, position, _, ref, alts = columns[:5]
+        ref = "" if ref in (".", "-") else ref
+        for alt in alts.split(","):
+            yield name, Variant(int(position) - 1, ref, "" if alt in (".", "-") else alt)
+
+def _open(path, standard, mode):
+    """Open a text file, or a context for the standard stream when path is '-'"""
+    return contextlib.nullcontext(standard) if path == "-" else open(path, mode, encoding="ascii")
+
+def main(argv=None):
+    """Report the effect of the variants of a VCF file on indexed coding sequences"""
+    parser = argparse.ArgumentParser(
+        description="Classify variants of coding sequences as synonymous, missense, "
+                    "nonsense, frameshift, ...")
+    parser.add_argument("fasta", help="uncompressed FASTA file of coding sequences (CDS)")
+    parser.add_argument("vcf", help="variants, with the CDS names as CHROM ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="effects as tab-separated values (default: stdout)")
+    parser.add_argument("--code", type=translation.code_option, default=translation.STANDARD,
+                        metavar="N", help="NCBI genetic code (default: 1, standard)")
+    args = parser.parse_args(argv)
+    counts = {}
+    try:
+        with TranscriptSet(args.fasta, args.code) as transcripts, \
+                _open(args.vcf, sys.stdin, "r") as handle, \
+                _open(args.output, sys.stdout, "w") as output:
+            for name, variant in read_vcf(handle):
+                effect = transcripts[name].effect(variant)
+                counts[effect.consequence] = counts.get(effect.consequence, 0) + 1
+                output.write(f"{name}\t{variant.position + 1}\t{variant.ref or '-'}\t"
+                             f"{variant.alt or '-'}\t{effect.consequence}\t"
+                             f"{protein_change(effect)}\n")
+    except KeyError as error:
+        parser.exit(1, f"[!] No transcript named {error.args[0]!r} in {args.fasta}\n")
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"[!] {error}\n")
+    summary = ", ".join(f"{count:,} {consequence}" for consequence, count in sorted(counts.items()))
+    print(f"[variants] {summary or 'no variants'}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()